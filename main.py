@@ -7,6 +7,7 @@ import faulthandler
 faulthandler.enable()  # Enable fault handler for better error reporting
 
 # **** IMPORTS ****
+import os
 import sys
 import logging
 from pathlib import Path
@@ -17,7 +18,7 @@ from tagsense.util import discover_classes
 from tagsense.searches.app_search import AppSearch
 from tagsense.database import get_db_connection
 from tagsense.views.main_window import MainWindow
-from tagsense.config import LOGGER_CONFIG, DB_PATH
+from tagsense.config import LOGGER_CONFIG, DB_PATH, BASE_DIR, PYCACHE_DIR
 from tagsense.processes.app_process import AppProcess
 from tagsense.data_structures.app_data_structure import AppDataStructure
 from tagsense.searches.app_search import generate_search_classes
@@ -44,6 +45,11 @@ sys.excepthook = global_exception_hook
 def main() -> None:
     global conn
     
+    # ****
+    # Keep plugin bytecode somewhere writable so discovery doesn't recompile on every start
+    if sys.pycache_prefix is None and not os.access(BASE_DIR, os.W_OK):
+        sys.pycache_prefix = str(PYCACHE_DIR)
+    
     # ****
     # Init DBs
     db_path = Path(DB_PATH)
@@ -63,7 +69,7 @@ def main() -> None:
         discovered_processes = discover_classes(Path(__file__).parent / "tagsense" / "processes" / "processes", AppProcess)
         for discovered_process in discovered_processes:
             discovered_process: AppProcess
-            if discovered_process.requires_installation:
+            if getattr(discovered_process, "requires_installation", False):
                 installed = registry.is_process_installed(discovered_process)
                 if not installed:
                     logger.info(f"Process {discovered_process.name} is not installed...")
@@ -76,7 +82,7 @@ def main() -> None:
             registry.register_processes({discovered_process})
 
         # Remove manual data structure from detected data structures
-        registry.detected_data_structures.remove(ManualDataStructure)
+        registry.unregister_data_structure(ManualDataStructure)
         ManualDataStructure.initialize()
         
         # ****
@@ -86,11 +92,9 @@ def main() -> None:
             logger.info(f"Initializing data structure: {data_structure.name}...")
             data_structure.initialize()
         generated_searches = generate_search_classes(conn, registry.detected_data_structures)
-        for search_name, search_instance in generated_searches.items():
-            registry.register_searches({search_instance})
+        registry.register_searches(set(generated_searches.values()))
         discovered_searches = discover_classes(Path(__file__).parent / "tagsense" / "searches" / "searches", AppSearch)
-        for discovered_search in discovered_searches:
-            registry.register_searches({discovered_search})
+        registry.register_searches(set(discovered_searches))
 
         # ****
         # Init GUI 
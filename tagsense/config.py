@@ -26,6 +26,9 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DB_PATH = DATA_DIR / "database.sqlite3"
 CLIENT_FILES_DIR = DATA_DIR / "client_files"
+THUMBNAIL_CACHE_DIR = DATA_DIR / "thumbnails"
+PYCACHE_DIR = DATA_DIR / "pycache"  # Used for bytecode when the source tree is read-only
+DISCOVERY_MANIFEST_DIR = DATA_DIR / "discovery"  # Plugin discovery manifests, one per scanned directory
 
 # **** LOGGING CONFIGURATION ****
 # Logging configurations
@@ -28,6 +28,8 @@ class AppDataStructure(DataStructure):
     # **** CLASS ATTRIBUTES ****
     table: SQLITETable
     db_path: Path
+    _read_by_entry_key_sql: str
+    _read_by_input_key_sql: str
     
     # **** DUNDER METHODS ****
     def __init_subclass__(cls, **kwargs):
@@ -41,6 +43,10 @@ class AppDataStructure(DataStructure):
         
         # Generate UID once per subclass
         cls.uid = cls.get_uid()
+
+        # Build lookup statements once per subclass so identical SQL is reused
+        cls._read_by_entry_key_sql = f"SELECT * FROM {cls.table.table_name} WHERE entry_key = ?"
+        cls._read_by_input_key_sql = f"SELECT * FROM {cls.table.table_name} WHERE input_data_key = ?"
         
         # Verify subclass attributes
         cls.verify()
@@ -157,21 +163,41 @@ class AppDataStructure(DataStructure):
     @classmethod
     def read_by_entry_key(cls, key: str) -> Optional[Dict[str, Any]]:
         with get_db_connection(cls.db_path) as conn:
-            existing_record = conn.execute(
-                f"SELECT * FROM {cls.table.table_name} WHERE entry_key = ?",
-                (key,)
-            ).fetchone()
+            existing_record = conn.execute(cls._read_by_entry_key_sql, (key,)).fetchone()
         return existing_record
 
     @classmethod
     def read_by_input_key(cls, key: str) -> Optional[Dict[str, Any]]:
         with get_db_connection(cls.db_path) as conn:
-            existing_record = conn.execute(
-                f"SELECT * FROM {cls.table.table_name} WHERE input_data_key = ?",
-                (key,)
-            ).fetchone()
+            existing_record = conn.execute(cls._read_by_input_key_sql, (key,)).fetchone()
         return existing_record
 
+    @classmethod
+    def read_by_input_keys(cls, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the records for several input keys in as few queries as SQLite's parameter limit allows.
+
+        Args:
+            keys (List[str]): Input data keys to look up.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The first record found for each input key. Keys without a record are left out.
+        """
+        keys = list(dict.fromkeys(keys))
+        batch_size = cls.table.max_variables
+        records = {}
+        with get_db_connection(cls.db_path) as conn:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start:start + batch_size]
+                rows = conn.execute(
+                    f"SELECT * FROM {cls.table.table_name} WHERE input_data_key IN ({', '.join(['?'] * len(batch))}) "
+                    "ORDER BY rowid",
+                    batch,
+                ).fetchall()
+                for row in rows:
+                    records.setdefault(row["input_data_key"], row)
+        return records
+
     @classmethod
     def update(cls, row_id: int, updates: Dict[str, Any]) -> None:
         """
@@ -220,6 +246,53 @@ class AppDataStructure(DataStructure):
         with get_db_connection(cls.db_path) as conn:
             return cls.table.fetch_all(conn)
 
+    @classmethod
+    def list_filtered(cls, entry_whitelist: Optional[List[str]] = None, entry_blacklist: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        List data from the referenced table, filtering by entry key in SQL.
+
+        Args:
+            entry_whitelist (Optional[List[str]]): Entry keys to keep. Ignored if empty.
+            entry_blacklist (Optional[List[str]]): Entry keys to drop. Ignored if empty.
+
+        Returns:
+            List[Dict[str, Any]]: A list of records.
+        """
+        with get_db_connection(cls.db_path) as conn:
+            if entry_whitelist and len(entry_whitelist) == 1 and not entry_blacklist:
+                # A single entry, as the data view shows for its current record, reuses the prebuilt lookup
+                rows = conn.execute(cls._read_by_entry_key_sql, (entry_whitelist[0],)).fetchall()
+                return [dict(row) for row in rows]
+            return cls.table.fetch_filtered(conn, "entry_key", entry_whitelist, entry_blacklist)
+
+    @classmethod
+    def count_entries(cls) -> int:
+        """Count the records in the referenced table."""
+        with get_db_connection(cls.db_path) as conn:
+            return cls.table.count(conn)
+
+    @classmethod
+    def count_entries_before(cls, rowid: int) -> int:
+        """Count the records preceding a rowid in the referenced table."""
+        with get_db_connection(cls.db_path) as conn:
+            return cls.table.count_before(conn, rowid)
+
+    @classmethod
+    def list_page(cls, after_rowid: Optional[int], limit: int, skip: int = 0) -> List[Dict[str, Any]]:
+        """
+        List one page of data from the referenced table, in rowid order.
+
+        Args:
+            after_rowid (Optional[int]): Rowid of the last record on the previous page. None to start at the beginning.
+            limit (int): Maximum number of records to return.
+            skip (int, optional): Records to skip first, for jumping to a page without a known starting rowid.
+
+        Returns:
+            List[Dict[str, Any]]: A list of records.
+        """
+        with get_db_connection(cls.db_path) as conn:
+            return cls.table.fetch_page(conn, after_rowid, limit, skip)
+
     @classmethod
     def fetch_all_entry_keys(cls):
         """Fetch all keys from the data structure."""
@@ -161,6 +161,12 @@ class DataStructure:
         entry_key = next((k for k, v in cls._storage.items() if v["input_data_key"] == key), None)
         return cls.read_by_entry_key(entry_key)
 
+    @classmethod
+    def read_by_input_keys(cls, keys: List[str]) -> Dict[str, Any]:
+        """Read data for several input keys at once. Keys without an entry are left out."""
+        entries = {key: cls.read_by_input_key(key) for key in keys}
+        return {key: entry for key, entry in entries.items() if entry is not None}
+
     @classmethod
     def update(cls, key: str, updates: Dict[str, Any]) -> Optional[Any]:
         """Update an existing entry."""
@@ -18,6 +18,7 @@ class SQLITETable:
     # **** CLASS ATTRIBUTES ****
     table_name: str = ""  # Must be overridden in subclasses
     required_columns: set = set()  # Must be overridden in subclasses
+    max_variables: int = 900  # Bound parameters per statement; older SQLite builds cap this at 999
 
     # **** DUNDER METHODS ****
     def __new__(cls, *args, **kwargs):
@@ -105,6 +106,88 @@ class SQLITETable:
         desc = [d[0] for d in cursor.description]
         return [dict(zip(desc, row)) for row in rows]
 
+    @classmethod
+    def count(cls, conn: sqlite3.Connection) -> int:
+        """
+        Count the records in the table.
+        """
+        return conn.execute(f"SELECT COUNT(*) FROM {cls.table_name}").fetchone()[0]
+
+    @classmethod
+    def count_before(cls, conn: sqlite3.Connection, rowid: int) -> int:
+        """
+        Count the records preceding a rowid, which is that record's position in rowid order.
+        """
+        return conn.execute(f"SELECT COUNT(*) FROM {cls.table_name} WHERE rowid < ?", (rowid,)).fetchone()[0]
+
+    @classmethod
+    def fetch_page(
+        cls,
+        conn: sqlite3.Connection,
+        after_rowid: Optional[int],
+        limit: int,
+        skip: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to `limit` records following `after_rowid` in rowid order, as a list of dicts.
+        Pages are continued from the last rowid seen, so each page costs the same however deep it is.
+        `skip` is only for jumping to a page whose preceding rowid is not known.
+        """
+        cursor = conn.execute(
+            f"SELECT * FROM {cls.table_name} WHERE rowid > ? ORDER BY rowid LIMIT ? OFFSET ?",
+            (after_rowid if after_rowid is not None else -1, limit, skip),
+        )
+        rows = cursor.fetchall()
+        desc = [d[0] for d in cursor.description]
+        return [dict(zip(desc, row)) for row in rows]
+
+    @classmethod
+    def fetch_filtered(
+        cls,
+        conn: sqlite3.Connection,
+        column: str,
+        include: Optional[List[Any]] = None,
+        exclude: Optional[List[Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch records whose column value is in `include` and not in `exclude`, as a list of dicts.
+        Empty or missing filters are ignored. Records are returned in rowid order.
+        Large filters are bound in batches to stay under SQLite's parameter limit.
+        """
+        include = list(dict.fromkeys(include)) if include else []
+        exclude = list(exclude) if exclude else []
+
+        # Exclusions too large to bind alongside the inclusions are applied afterwards
+        excluded_after = set()
+        if len(exclude) > cls.max_variables // 2:
+            excluded_after = set(exclude)
+            exclude = []
+
+        batch_size = cls.max_variables - len(exclude)
+        include_batches = [include[i:i + batch_size] for i in range(0, len(include), batch_size)] or [[]]
+
+        records = []
+        for include_batch in include_batches:
+            clauses = []
+            params = []
+            if include_batch:
+                clauses.append(f"{column} IN ({', '.join(['?'] * len(include_batch))})")
+                params.extend(include_batch)
+            if exclude:
+                clauses.append(f"{column} NOT IN ({', '.join(['?'] * len(exclude))})")
+                params.extend(exclude)
+            where_clause = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            cursor = conn.execute(f"SELECT * FROM {cls.table_name}{where_clause} ORDER BY rowid", params)
+            rows = cursor.fetchall()
+            desc = [d[0] for d in cursor.description]
+            records.extend(dict(zip(desc, row)) for row in rows)
+
+        if len(include_batches) > 1:
+            records.sort(key=lambda record: record["rowid"])
+        if excluded_after:
+            records = [record for record in records if record[column] not in excluded_after]
+        return records
+
     @classmethod
     def _verify_columns(cls, conn: sqlite3.Connection, table_name: str, required_columns: set) -> bool:
         """
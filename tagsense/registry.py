@@ -7,6 +7,8 @@ Base foundation for processes.
 # **** IMPORTS ****
 import sqlite3
 import logging
+import threading
+from typing import Optional
 
 from tagsense.config import DB_PATH
 from tagsense.database import get_db_connection
@@ -17,8 +19,17 @@ from tagsense.data_structures.data_structure import DataStructure
 
 # **** CONSTANTS *****
 process_registry: set[Process] = set()
+process_registry_by_uid: dict[str, Process] = {}
+processes_by_input: dict[DataStructure, frozenset[Process]] = {}
 search_registry: set[Search] = set()
+search_registry_by_name: dict[str, Search] = {}
+searches_by_data_structure: dict[DataStructure, frozenset[Search]] = {}
 detected_data_structures: set[DataStructure] = set()
+detected_data_structures_by_uid: dict[str, DataStructure] = {}
+# UIDs of installed processes, read from the database on first use
+_installed_process_uids: Optional[set[str]] = None
+# Processes are installed from worker threads while the GUI thread reads the UIDs
+_installed_process_uids_lock = threading.Lock()
 
 # **** LOGGING ****
 logger = logging.getLogger(__name__)
@@ -44,18 +55,37 @@ class InstalledProcesses(SQLITETable):
 def register_processes(classes: set[Process]):
     """Registers discovered process classes."""
     process_registry.update(classes)
+    process_registry_by_uid.update((process_cls.uid, process_cls) for process_cls in classes)
 
     # Add to relevant registries
     for process_cls in classes:
         process_cls: Process
         if process_cls.input:
-            detected_data_structures.add(process_cls.input)
+            register_data_structure(process_cls.input)
+            processes_by_input[process_cls.input] = (
+                processes_by_input.get(process_cls.input, frozenset()) | {process_cls}
+            )
         if process_cls.output:
-            detected_data_structures.add(process_cls.output)
+            register_data_structure(process_cls.output)
+
+def register_data_structure(data_structure: DataStructure):
+    """Registers a detected data structure and indexes it by UID."""
+    detected_data_structures.add(data_structure)
+    detected_data_structures_by_uid[data_structure.get_uid()] = data_structure
+
+def unregister_data_structure(data_structure: DataStructure):
+    """Removes a detected data structure and its UID index entry."""
+    detected_data_structures.discard(data_structure)
+    detected_data_structures_by_uid.pop(data_structure.get_uid(), None)
 
 def register_searches(classes: set[Search]):
     """Registers discovered search classes."""
     search_registry.update(classes)
+    search_registry_by_name.update((search_cls.name, search_cls) for search_cls in classes)
+    for search_cls in classes:
+        searches_by_data_structure[search_cls.data_structure] = (
+            searches_by_data_structure.get(search_cls.data_structure, frozenset()) | {search_cls}
+        )
 
 def mark_process_as_installed(process_cls: Process):
     """Marks a process class as installed."""
@@ -68,47 +98,45 @@ def mark_process_as_installed(process_cls: Process):
             raise Exception(f"Process {process_cls.name} is already installed.")
         # Insert into the installed processes table
         InstalledProcesses.insert_record(conn, {"process_uid": process_cls.uid})
+    with _installed_process_uids_lock:
+        if _installed_process_uids is not None:
+            _installed_process_uids.add(process_cls.uid)
+
+def _fetch_installed_process_uids() -> tuple[str, ...]:
+    """Returns a snapshot of the UIDs of installed processes, only querying the database the first time."""
+    global _installed_process_uids
+    with _installed_process_uids_lock:
+        if _installed_process_uids is None:
+            with get_db_connection(DB_PATH) as conn:
+                InstalledProcesses.create_table(conn)
+                _installed_process_uids = {record["process_uid"] for record in InstalledProcesses.fetch_all(conn)}
+        return tuple(_installed_process_uids)
     
 def fetch_installed_processes() -> set[Process]:
     installed_processes = set()
-    with get_db_connection(DB_PATH) as conn:
-        InstalledProcesses.create_table(conn)
-        existing_data = InstalledProcesses.fetch_all(conn)
-        for existing_record in existing_data:
-            process_uid = existing_record["process_uid"]
-            process_cls = fetch_process_by_uid(process_uid)
-            if process_cls:
-                installed_processes.add(process_cls)
-            else:
-                logger.warning(f"Installed process with UID {process_uid} not found in registry.")
+    for process_uid in _fetch_installed_process_uids():
+        process_cls = fetch_process_by_uid(process_uid)
+        if process_cls:
+            installed_processes.add(process_cls)
+        else:
+            logger.warning(f"Installed process with UID {process_uid} not found in registry.")
     return installed_processes
 
 def is_process_installed(process_cls: Process) -> bool:
     """Checks if a process class is installed."""
-    existing_data = []
-    with get_db_connection(DB_PATH) as conn:
-        InstalledProcesses.create_table(conn)
-        existing_data = InstalledProcesses.fetch_all(conn)
-    existing = any(record["process_uid"] == process_cls.uid for record in existing_data)
-    return existing
+    return process_cls.uid in _fetch_installed_process_uids()
 
 def fetch_search_by_name(name: str) -> Search:
     """Fetches a search by name."""
-    for search in search_registry:
-        if search.name == name:
-            return search
+    return search_registry_by_name.get(name)
 
 def fetch_process_by_uid(uid: str) -> Process:
     """Fetches a process by UID."""
-    for process in process_registry:
-        if process.uid == uid:
-            return process
+    return process_registry_by_uid.get(uid)
 
 def fetch_data_structure_by_uid(uid: str) -> DataStructure:
     """Fetches a data structure by UID."""
-    for data_structure in detected_data_structures:
-        if data_structure.uid == uid:
-            return data_structure
+    return detected_data_structures_by_uid.get(uid)
 
 
 
@@ -10,10 +10,13 @@ import logging
 from PIL import Image
 from PIL.Image import Image as PILImage
 import sqlite3
+from functools import lru_cache
+from typing import Any, Optional, List, Tuple
 
 from tagsense.searches.search import Search
-from tagsense.registry import detected_data_structures
+from tagsense.registry import detected_data_structures_by_uid
 from tagsense.data_structures.data_structure import DataStructure
+from tagsense.data_structures.app_data_structure import AppDataStructure
 from tagsense.data_structures.data_structures.file_table.file_table import Files
 
 # **** LOGGING ****
@@ -28,17 +31,52 @@ class AppSearch(Search):
         return "No help text available."
     
     @classmethod
-    def generate_thumbnail(cls, result: dict, thumbnail_size=(300, 300)) -> Image.Image | None:
+    def fetch_results(cls, entry_whitelist: Optional[List[str]] = None, entry_blacklist: Optional[List[str]] = None) -> list[dict]:
+        """Fetches search results, pushing entry filters into the database when possible."""
+        if issubclass(cls.data_structure, AppDataStructure):
+            return cls.data_structure.list_filtered(entry_whitelist, entry_blacklist)
+        return super().fetch_results(entry_whitelist, entry_blacklist)
+    
+    @classmethod
+    def _results_are_table_rows(cls) -> bool:
         """
-        Attempts to find an associated file and generate a thumbnail.
-        
-        Args:
-            result (dict): A dictionary containing a "file_path" key or references a file.
-            thumbnail_size (tuple, optional): The size of the generated thumbnail.
-        
-        Returns:
-            Image.Image | None: The generated thumbnail image, or None if the file is invalid.
+        Whether the unfiltered results are exactly the data structure's table rows in rowid order,
+        so they can be counted, paged and located in SQL. Searches overriding `fetch_results`,
+        e.g. to filter or sort, are left to it.
         """
+        return (
+            issubclass(cls.data_structure, AppDataStructure)
+            and cls.fetch_results.__func__ is AppSearch.fetch_results.__func__
+        )
+
+    @classmethod
+    def count_results(cls) -> int:
+        """Counts the search results in the database when possible."""
+        if cls._results_are_table_rows():
+            return cls.data_structure.count_entries()
+        return super().count_results()
+
+    @classmethod
+    def fetch_results_page(cls, page_idx: int, page_size: int, after_key: Any = None) -> Tuple[list[dict], Any]:
+        """Fetches a page of search results, continuing from the previous page's last rowid when it is known."""
+        if not cls._results_are_table_rows():
+            return super().fetch_results_page(page_idx, page_size, after_key)
+        if after_key is None:
+            records = cls.data_structure.list_page(None, page_size, skip=page_idx * page_size)
+        else:
+            records = cls.data_structure.list_page(after_key, page_size)
+        return records, records[-1]["rowid"] if records else None
+
+    @classmethod
+    def result_index(cls, result: dict) -> int:
+        """Finds the position of a result by counting the records before it in the database when possible."""
+        if cls._results_are_table_rows() and "rowid" in result:
+            return cls.data_structure.count_entries_before(result["rowid"])
+        return super().result_index(result)
+
+    @classmethod
+    def thumbnail_source_path(cls, result: dict) -> Optional[str]:
+        """Returns the result's file, or else the file of the entry it was created from."""
         file_path = result.get("file_path")
         
         # Attempt to find a file reference in the input data structure
@@ -49,25 +87,38 @@ class AppSearch(Search):
             input_data_structure: DataStructure = None
             if input_data_structure_uid:
                 # Find the corresponding data structure
-                for detected_data_structure in detected_data_structures:
-                    detected_data_structure: DataStructure
-                    if detected_data_structure.uid == input_data_structure_uid:
-                        input_data_structure = detected_data_structure
+                input_data_structure = detected_data_structures_by_uid.get(input_data_structure_uid)
 
             if input_data_structure:
                 # Fetch input data key from result
                 input_data_key = cls.data_structure.fetch_input_data_key_from_entry(result)
                 if input_data_key:
-                    input_data = dict(input_data_structure.read_by_entry_key(input_data_key))
-                    if input_data:
-                        file_path = input_data.get("file_path")
-            
+                    file_path = _input_file_path(input_data_structure, input_data_key)
+        
+        return file_path or None
+
+    @classmethod
+    def generate_thumbnail(cls, result: dict, thumbnail_size=(300, 300)) -> Image.Image | None:
+        """
+        Attempts to find an associated file and generate a thumbnail.
+        
+        Args:
+            result (dict): A dictionary containing a "file_path" key or references a file.
+            thumbnail_size (tuple, optional): The size of the generated thumbnail.
+        
+        Returns:
+            Image.Image | None: The generated thumbnail image, or None if the file is invalid.
+        """
+        file_path = cls.thumbnail_source_path(result)
         if file_path and os.path.exists(file_path):
             try:
                 with Image.open(file_path) as img:
+                    # Let JPEGs decode at a reduced scale (no-op for other formats); twice the
+                    # target size leaves LANCZOS enough pixels, as Image.thumbnail does itself
+                    img.draft(None, (512, 512))
                     img = img.convert("RGBA")  # or "RGBA" if transparency needed
                     img.thumbnail((256, 256), Image.Resampling.LANCZOS)
-                    return img.copy()
+                    return img
             except Exception as e:
                 logger.warning(f"Error generating thumbnail for {file_path}: {e}")
         
@@ -88,18 +139,36 @@ def generate_search_classes(conn: sqlite3.Connection, data_structures: list[Data
     search_classes = {}
 
     for data_structure in data_structures:
-        search_class = type(
-            data_structure.name,  # Dynamically assign class name
-            (AppSearch,),  # Base class
-            {
-                "name": data_structure.name,  # Explicitly set the class attribute
-                "data_structure": data_structure
-            }
-        )
-        search_classes[data_structure.name] = search_class
+        search_classes[data_structure.name] = _generate_search_class(data_structure)
     
     return search_classes
 
+@lru_cache(maxsize=4096)
+def _input_file_path(input_data_structure: DataStructure, input_data_key: str) -> Optional[str]:
+    """
+    Returns the file path of an input entry.
+    Cached, as an entry's input never changes and this is looked up for every thumbnail shown.
+    """
+    input_data = input_data_structure.read_by_entry_key(input_data_key)
+    if not input_data:
+        return None
+    return dict(input_data).get("file_path")
+
+@lru_cache(maxsize=None)
+def _generate_search_class(data_structure: DataStructure) -> AppSearch:
+    """
+    Generates the search class for a single data structure.
+    Cached so repeated calls return the same class instead of rebuilding it.
+    """
+    return type(
+        data_structure.name,  # Dynamically assign class name
+        (AppSearch,),  # Base class
+        {
+            "name": data_structure.name,  # Explicitly set the class attribute
+            "data_structure": data_structure
+        }
+    )
+
 
 # ****
 if __name__ == "__main__":
@@ -7,7 +7,8 @@ Base foundation for searches.
 # **** IMPORTS ****
 from PIL import Image
 from PIL.Image import Image as PILImage
-from typing import Optional, List, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List, Tuple
 
 from tagsense.data_structures.data_structure import DataStructure
 
@@ -23,17 +24,60 @@ class Search:
         results = cls.data_structure.list_all()
         return cls.filter_results(results, entry_whitelist, entry_blacklist)
     
+    @classmethod
+    def count_results(cls) -> int:
+        """Counts the unfiltered search results."""
+        return len(cls.fetch_results())
+
+    @classmethod
+    def fetch_results_page(cls, page_idx: int, page_size: int, after_key: Any = None) -> Tuple[list[dict], Any]:
+        """
+        Fetches one page of unfiltered search results.
+
+        Args:
+            page_idx (int): Index of the page to fetch.
+            page_size (int): Number of results per page.
+            after_key (Any, optional): Key returned with the previous page, if known. Defaults to None.
+
+        Returns:
+            Tuple[list[dict], Any]: The page of results and the key to fetch the following page with.
+        """
+        start = page_idx * page_size
+        return cls.fetch_results()[start:start + page_size], None
+
+    @classmethod
+    def result_index(cls, result: dict) -> int:
+        """
+        Finds the position of a result among the unfiltered search results.
+
+        Args:
+            result (dict): A result of this search.
+
+        Returns:
+            int: Index of the result, as used by `fetch_results_page` and `ResultPager`.
+        """
+        entry_key = result.get("entry_key")
+        return next(idx for idx, other in enumerate(cls.fetch_results()) if other.get("entry_key") == entry_key)
+
     @classmethod
     def filter_results(self, results: List[dict], entry_whitelist: Optional[List[str]] = None, entry_blacklist: Optional[List[str]] = None) -> list[dict]:
         """Filters search results."""
+        # Sets make each membership test constant time; empty filters are ignored
+        entry_whitelist = set(entry_whitelist) if entry_whitelist else None
+        entry_blacklist = set(entry_blacklist) if entry_blacklist else None
+        if entry_whitelist is None and entry_blacklist is None:
+            return list(results)
+
+        fetch_entry_key = self.data_structure.fetch_entry_key_from_entry
         filtered_results = []
+        append = filtered_results.append
         for result in results:
-            result_entry_key = self.data_structure.fetch_entry_key_from_entry(result)
-            if entry_blacklist and result_entry_key in entry_blacklist:
+            result_entry_key = fetch_entry_key(result)
+            if entry_blacklist is not None and result_entry_key in entry_blacklist:
                 continue
-            if entry_whitelist and result_entry_key not in entry_whitelist:
+            if entry_whitelist is not None and result_entry_key not in entry_whitelist:
                 continue
-            filtered_results.append(result)
+            append(result)
         return filtered_results
 
     @classmethod
@@ -80,10 +124,67 @@ class Search:
     def handle_natural_language_query(cls, query: str) -> list[dict]:
         raise NotImplementedError("Subclasses must implement this method.")
     
+    @classmethod
+    def thumbnail_source_path(cls, result: dict) -> Optional[str]:
+        """Returns the file a result's thumbnail is generated from, if any, so cached thumbnails follow changes to it."""
+        return None
+
     @classmethod
     def generate_thumbnail(cls, result: dict, thumbnail_size=(100,100)) -> PILImage:
-        return Image.new("RGB", size=thumbnail_size, color=(200,200,200))
+        thumbnail = Image.new("RGB", size=thumbnail_size, color=(200,200,200))
+        thumbnail.info["placeholder"] = True  # Stands in for a missing image, so it is never cached
+        return thumbnail
         
+class ResultPager:
+    """
+    Indexable view of a search's unfiltered results that fetches them a page at a time.
+    Only the most recently used pages are kept, so memory follows the page size, not the result count.
+    """
+
+    def __init__(self, search: Search, page_size: int = 64, max_pages: int = 4) -> None:
+        """Initializes the ResultPager.
+
+        Args:
+            search (Search): Search to page through.
+            page_size (int, optional): Results fetched per page. Defaults to 64.
+            max_pages (int, optional): Pages kept in memory at once. Defaults to 4.
+        """
+        self.search = search
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._length = search.count_results()
+        self._pages: OrderedDict[int, list[dict]] = OrderedDict()
+        self._page_keys: Dict[int, Any] = {}  # Key each page continues from, once known
+
+    def refresh(self) -> None:
+        """Re-counts the results, dropping the cached pages if records were added or removed since."""
+        length = self.search.count_results()
+        if length != self._length:
+            self._length = length
+            self._pages.clear()
+            self._page_keys.clear()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, idx: int) -> dict:
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError("Result index out of range.")
+        page_idx, offset = divmod(idx, self.page_size)
+        page = self._pages.get(page_idx)
+        if page is None:
+            page, next_key = self.search.fetch_results_page(page_idx, self.page_size, self._page_keys.get(page_idx))
+            if next_key is not None:
+                self._page_keys[page_idx + 1] = next_key
+            self._pages[page_idx] = page
+            if len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_idx)
+        return page[offset]
+
 
 # ****
 if __name__ == "__main__":
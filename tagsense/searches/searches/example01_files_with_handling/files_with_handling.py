@@ -5,9 +5,6 @@ Search that returns only the even rows from the database.
 """
 
 # **** IMPORTS ****
-import os
-from PIL import Image
-
 from tagsense.searches.app_search import AppSearch
 from tagsense.data_structures.app_data_structure import AppDataStructure
 from tagsense.data_structures.data_structures.file_table.file_table import Files
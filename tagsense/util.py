@@ -5,20 +5,34 @@ Utilities for the application.
 """
 
 # **** IMPORTS ****
+import os
 import re
+import json
+import sys
+import heapq
+import hashlib
 import logging
-import inspect
 import importlib.util
+import importlib.machinery
 from pathlib import Path
+from functools import lru_cache
 from collections import deque
-from typing import List, Type
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Iterator, List, Optional, Tuple, Type, Union
 
-from PyQt6.QtWidgets import QTableWidget
-from PyQt6.QtWidgets import QTableWidget
+from PyQt6.QtCore import Qt, QAbstractItemModel
+from PyQt6.QtWidgets import QAbstractItemView
+
+from tagsense.config import DISCOVERY_MANIFEST_DIR
 
 # **** LOGGER ****
 logger = logging.getLogger(__name__)
 
+# **** CONSTANTS ****
+# Directories that never hold plugins; hidden directories (.git, .venv, ...) are skipped too
+DISCOVERY_SKIP_DIRS = frozenset({"__pycache__", "venv", "env", "build", "dist", "node_modules", "test", "tests"})
+
 # **** CLASSES ****
 class QueryValidator:
     """
@@ -30,13 +44,24 @@ class QueryValidator:
     - validate_tag(tag): Validates an individual tag.
     """
 
+    # Each word has a single reading, so a query that fails to match is rejected in linear
+    # time instead of backtracking through every operator/tag reading of "and" and "or".
+    # A spaced operator reads the same as a tag of that name, so only an operator glued
+    # to a negated tag ("or-b") is matched as one; inside a group, "orb" is still a tag.
     TAG_REGEX = r"-?\w+"
-    GROUP_REGEX = rf"-?\(\s*(?:{TAG_REGEX}(?:\s+(?:and|or)?\s*{TAG_REGEX})+)\s*\)"
-    ELEMENT_REGEX = rf"(?:{GROUP_REGEX}|{TAG_REGEX})"
     OPERATOR_REGEX = r"(?:and|or)"
+    GROUP_REGEX = rf"-?\(\s*(?:{TAG_REGEX}(?:\s+(?:{OPERATOR_REGEX}(?=-))?{TAG_REGEX})+)\s*\)"
+    ELEMENT_REGEX = rf"(?:{GROUP_REGEX}|{TAG_REGEX})"
 
+    # An operator between elements is itself matched by ELEMENT_REGEX as a tag
     QUERY_PATTERN = re.compile(
-        rf"{ELEMENT_REGEX}(?:\s+(?:{OPERATOR_REGEX}\s+)?{ELEMENT_REGEX})*",
+        rf"{ELEMENT_REGEX}(?:\s+{ELEMENT_REGEX})*",
+        re.VERBOSE | re.IGNORECASE,
+    )
+
+    # Whole-string form of QUERY_PATTERN, compiled once with the class
+    FULL_QUERY_PATTERN = re.compile(
+        rf"\A\s*{QUERY_PATTERN.pattern}\s*\Z",
         re.VERBOSE | re.IGNORECASE,
     )
 
@@ -47,10 +72,7 @@ class QueryValidator:
     @classmethod
     def validate_query(cls, query: str) -> bool:
         """Validate entire query syntax."""
-        full_query_pattern = re.compile(
-            rf"^\s*{cls.QUERY_PATTERN.pattern}\s*$", re.VERBOSE | re.IGNORECASE
-        )
-        return bool(full_query_pattern.match(query))
+        return cls.FULL_QUERY_PATTERN.match(query) is not None
 
     @classmethod
     def find_queries(cls, text: str):
@@ -60,9 +82,9 @@ class QueryValidator:
         """
         matches = []
         for match in cls.QUERY_PATTERN.finditer(text):
-            query_str = match.group()
-            tags = cls.TAG_SEARCH_PATTERN.findall(query_str)
-            matches.append({"query": query_str, "tags": tags})
+            # Tags are read straight from the match's span of the text rather than a copy of it
+            tags = cls.TAG_SEARCH_PATTERN.findall(text, *match.span())
+            matches.append({"query": match.group(), "tags": tags})
         return matches
 
     @classmethod
@@ -76,7 +98,9 @@ def sort_processes(processes: set) -> list:
     """
     Sorts a set of Processes so that any process producing a data structure
     is placed before processes requiring that data structure. In the event
-    of a cycle, those processes involved in the cycle are placed at the end.
+    of a cycle, those processes involved in the cycle are placed at the end,
+    each time choosing the one with the fewest producers still unplaced.
+    The dependencies ignored to break cycles are logged.
 
     Args:
         processes (Set[Process]): Set of process classes to sort.
@@ -88,28 +112,70 @@ def sort_processes(processes: set) -> list:
     adjacency = {proc: [] for proc in processes_list}
     in_degree = {proc: 0 for proc in processes_list}
 
+    # Bucket processes by input so each output only visits its consumers
+    input_index = {}
+    for proc in processes_list:
+        inp = getattr(proc, "input", None)
+        if inp is not None:
+            input_index.setdefault(inp, []).append(proc)
+
     for p1 in processes_list:
-        for p2 in processes_list:
-            if p1 is p2:
+        out = getattr(p1, "output", None)
+        if out is None:
+            continue
+        for p2 in input_index.get(out, ()):
+            if p2 is p1:
                 continue
-            if getattr(p1, "output", None) == getattr(p2, "input", None):
-                adjacency[p1].append(p2)
-                in_degree[p2] += 1
+            adjacency[p1].append(p2)
+            in_degree[p2] += 1
 
     queue = deque([p for p in processes_list if in_degree[p] == 0])
     result = []
+    placed = set()
 
     while queue:
         current = queue.popleft()
         result.append(current)
+        placed.add(current)
         for neighbor in adjacency[current]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
 
-    remaining = [p for p in processes_list if p not in result]
-    return result + remaining
+    if len(result) < len(processes_list):
+        # Cycles remain; repeatedly place the process with the fewest unplaced producers.
+        # Heap entries go stale as degrees drop, so outdated ones are skipped when popped.
+        order = {proc: idx for idx, proc in enumerate(processes_list)}
+        heap = [(in_degree[p], order[p], p) for p in processes_list if p not in placed]
+        heapq.heapify(heap)
+        producers = {proc: [] for proc in processes_list}
+        for producer, consumers in adjacency.items():
+            for consumer in consumers:
+                producers[consumer].append(producer)
+        broken_edges = []
+        while heap:
+            degree, _, current = heapq.heappop(heap)
+            if current in placed or degree != in_degree[current]:
+                continue
+            if degree:
+                # Producers still unplaced are the edges this placement ignores
+                broken_edges.extend((producer, current) for producer in producers[current] if producer not in placed)
+            result.append(current)
+            placed.add(current)
+            for neighbor in adjacency[current]:
+                if neighbor not in placed:
+                    in_degree[neighbor] -= 1
+                    heapq.heappush(heap, (in_degree[neighbor], order[neighbor], neighbor))
+
+        logger.warning(
+            "Process dependencies form a cycle; running %s",
+            ", ".join(f"{getattr(consumer, 'name', consumer)} before {getattr(producer, 'name', producer)}"
+                      for producer, consumer in broken_edges),
+        )
+
+    return result
 
+@lru_cache(maxsize=512)
 def create_divider(name: str, total_width: int = 50) -> str:
     """
     Creates a divider line with the given name centered among dashes.
@@ -126,63 +192,240 @@ def create_divider(name: str, total_width: int = 50) -> str:
     max_name_space = total_width - len(prefix)
     if name_len >= max_name_space:
         return f"# {name}"
-    space_for_dashes = max_name_space - name_len
-    left = space_for_dashes // 2
-    right = space_for_dashes - left
-    return prefix + ("-" * left) + name + ("-" * right)
+    # Format-spec centering puts any odd dash on the right, same as splitting by hand
+    return f"{prefix}{name:-^{max_name_space}}"
 
 
-def discover_classes(directory: Path, base_class: Type) -> List:
+def discover_classes(directory: Path, base_class: Type, aliases: Optional[List[str]] = None) -> List:
     """
     Recursively discovers any subclasses of a given base class within all .py files in the given directory.
+    Files that never mention the base class name (or one of the aliases) are not imported.
 
     Args:
         directory (Path): Path to the directory containing potential class modules.
         base_class (Type): The base class to search for subclasses.
+        aliases (Optional[List[str]]): Other names that mark a file as a candidate, e.g. intermediate subclasses.
 
     Returns:
         List: Instantiated subclasses of the specified base class.
     """
     discovered_classes = []
-
-    for module_path in directory.rglob("*.py"):
-        if module_path.name.startswith("__init__"):
+    root = str(directory)
+
+    # Manifest of what each file held on the last run, keyed per base class.
+    # Kept in the data directory, as the plugin directory may be read-only
+    manifest_path = _discovery_manifest_path(directory)
+    manifest_key = ",".join([f"{base_class.__module__}.{base_class.__qualname__}", *sorted(aliases or [])])
+    manifest = _load_discovery_manifest(manifest_path)
+    previous_entries = manifest.get(manifest_key, {})
+    entries = {}
+    needles = [name.encode() for name in [base_class.__name__, *(aliases or [])]]
+    # Modules of an importable package are loaded under their full dotted names,
+    # so they are the same module objects a normal import would give
+    package = _importable_package_name(directory)
+
+    def scan_module_file(module_path: str) -> Tuple[str, str, list, bool]:
+        """Stats and sniffs a file, returning its manifest entry and whether it needs importing."""
+        module_name = os.path.relpath(module_path, root)[:-3].replace(os.sep, ".")
+
+        # Unchanged files are decided by the manifest: skipped if they held no matching
+        # classes last time, imported without re-reading the source otherwise
+        stat = os.stat(module_path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        previous = previous_entries.get(module_name)
+        if previous and previous[:2] == signature:
+            if not previous[2]:
+                return module_name, module_path, previous, False
+            return module_name, module_path, signature, True
+
+        # Cheap content sniff before paying for module execution
+        with open(module_path, "rb") as file:
+            source = file.read()
+        if not any(needle in source for needle in needles):
+            return module_name, module_path, signature + [[]], False
+        return module_name, module_path, signature, True
+
+    # File I/O runs in parallel; imports stay serial since module bodies may not be thread-safe
+    # Sorted so classes are discovered, and the manifest written, in a stable order
+    module_paths = sorted(_walk_py_files(root))
+    with ThreadPoolExecutor(max_workers=min(32, len(module_paths) or 1)) as executor:
+        scanned_files = list(executor.map(scan_module_file, module_paths))
+
+    for module_name, module_path, signature, needs_import in scanned_files:
+        if not needs_import:
+            entries[module_name] = signature
             continue
 
-        module_name = (
-            module_path.relative_to(directory)
-            .with_suffix("")
-            .as_posix()
-            .replace("/", ".")
-        )
+        if package:
+            module = importlib.import_module(f"{package}.{module_name}")
+        else:
+            module = _load_or_get(module_name, module_path)
+
+        found_classes = []
+        for obj in module.__dict__.values():
+            if isinstance(obj, type) and issubclass(obj, base_class) and obj is not base_class:
+                found_classes.append(obj)
+        discovered_classes.extend(found_classes)
+        entries[module_name] = signature + [[obj.__qualname__ for obj in found_classes]]
 
-        spec = importlib.util.spec_from_file_location(module_name, module_path)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+    if discovered_classes:
+        logger.info("Discovered %s", ", ".join(obj.__name__ for obj in discovered_classes))
 
-            for _, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, base_class) and obj is not base_class:
-                    logger.info(f"Discovered {obj.__name__}")
-                    discovered_classes.append(obj)
+    if entries != previous_entries:
+        manifest[manifest_key] = entries
+        _save_discovery_manifest(manifest_path, manifest)
 
     return discovered_classes
 
-def get_row_data(table_widget: QTableWidget, row_idx: int) -> dict[str, str]:
+def _discovery_manifest_path(directory: Path) -> Path:
+    """
+    Returns the path of the discovery manifest for a scanned directory.
+
+    Args:
+        directory (Path): The directory being scanned.
+
+    Returns:
+        Path: Path to the manifest file, named after a hash of the directory's absolute path.
+    """
+    directory_key = hashlib.sha256(str(Path(directory).resolve()).encode()).hexdigest()[:16]
+    return DISCOVERY_MANIFEST_DIR / f"{directory_key}.json"
+
+def _load_discovery_manifest(manifest_path: Path) -> dict:
+    """
+    Loads a discovery manifest, returning an empty one if it is missing or unreadable.
+
+    Args:
+        manifest_path (Path): Path to the manifest file.
+
+    Returns:
+        dict: The manifest contents.
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable discovery manifest {manifest_path}: {e}")
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def _save_discovery_manifest(manifest_path: Path, manifest: dict) -> None:
+    """
+    Saves a discovery manifest. Failing to save only costs a full discovery on the next run.
+
+    Args:
+        manifest_path (Path): Path to the manifest file.
+        manifest (dict): The manifest contents.
+    """
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not save discovery manifest {manifest_path}: {e}")
+
+def _importable_package_name(directory: Path) -> Optional[str]:
+    """
+    Returns the dotted package name a directory is imported under, if it is part of an importable package.
+
+    Args:
+        directory (Path): The directory to name.
+
+    Returns:
+        Optional[str]: The package name, or None if the directory is not importable as a package.
+    """
+    parts = []
+    path = Path(directory).resolve()
+    while (path / "__init__.py").is_file():
+        parts.append(path.name)
+        path = path.parent
+    if not parts:
+        return None
+    parts.reverse()
+
+    # The top-level package must resolve to this very directory, not another copy on the path
+    spec = importlib.util.find_spec(parts[0])
+    if spec is None or not spec.origin or Path(spec.origin).resolve().parent != path / parts[0]:
+        return None
+    return ".".join(parts)
+
+def _walk_py_files(root: str) -> Iterator[str]:
+    """
+    Yields the paths of all non-`__init__` .py files under a directory.
+    Uses `os.scandir` so file types come from the directory entries without extra stat calls,
+    and prunes hidden directories and those in `DISCOVERY_SKIP_DIRS` without entering them.
+
+    Args:
+        root (str): The directory to walk.
+
+    Yields:
+        str: Path to a Python source file.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in DISCOVERY_SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif (
+                    entry.name.endswith(".py")
+                    and not entry.name.startswith("__init__")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    yield entry.path
+
+def _load_or_get(module_name: str, module_path: str) -> ModuleType:
+    """
+    Returns an already imported module from `sys.modules`, otherwise imports it from its file.
+
+    Args:
+        module_name (str): The name to register the module under.
+        module_path (str): Path to the module's source file.
+
+    Returns:
+        ModuleType: The module.
+    """
+    modules = sys.modules
+    module = modules.get(module_name)
+    if module is not None:
+        return module
+
+    # Files are always Python source, so build the spec directly instead of resolving a loader
+    loader = importlib.machinery.SourceFileLoader(module_name, module_path)
+    spec = importlib.machinery.ModuleSpec(module_name, loader, origin=module_path)
+    spec.has_location = True
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution, matching the import system, so circular imports resolve
+    modules[module_name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del modules[module_name]
+        raise
+    return module
+
+def get_row_data(view: Union[QAbstractItemView, QAbstractItemModel], row_idx: int) -> dict[str, str]:
     """
-    Fetches all data in a given row of a QTableWidget as a dictionary.
+    Fetches all data in a given row of a table as a dictionary.
+    Reads through the model, so it works for QTableWidget and model-backed views alike.
 
     Args:
-        table_widget (QTableWidget): The table widget.
+        view (Union[QAbstractItemView, QAbstractItemModel]): The table view, widget, or its model.
         row_idx (int): The row index.
 
     Returns:
         dict[str, str]: A dictionary mapping column headers to cell values.
     """
-    headers = [table_widget.horizontalHeaderItem(col).text() for col in range(table_widget.columnCount())]
-    values = [table_widget.item(row_idx, col).text() if table_widget.item(row_idx, col) else "" 
-              for col in range(table_widget.columnCount())]
-    return dict(zip(headers, values))
+    model = view.model() if isinstance(view, QAbstractItemView) else view
+    column_count = model.columnCount()
+    headers = [model.headerData(col, Qt.Orientation.Horizontal) for col in range(column_count)]
+    row_data = {}
+    for col, header in enumerate(headers):
+        value = model.data(model.index(row_idx, col))
+        row_data[header] = value if value is not None else ""
+    return row_data
 
 # ****
 if __name__ == "__main__":
@@ -7,10 +7,11 @@ View module for viewing a specific piece of data.
 # **** IMPORTS ****
 import sqlite3
 import logging
-from typing import List, Dict, Any
-from PIL import ImageQt
+import itertools
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set, Tuple
 
-from PyQt6.QtCore import QSize, Qt, QEvent, QTimer
+from PyQt6.QtCore import QSize, Qt, QEvent, QTimer, QPoint, QRect
 
 from PyQt6.QtGui import QPixmap, QIcon, QKeyEvent
 from PyQt6.QtWidgets import (
@@ -20,9 +21,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtWidgets import QSplitter, QSizePolicy
 
 from tagsense import registry
-from tagsense.searches.search import Search
+from tagsense.searches.search import Search, ResultPager
 from tagsense.processes.process import Process
-from tagsense.widgets import CustomGridTableWidget
+from tagsense.widgets import (
+    CustomGridTableWidget, thumbnail_cache_path, store_cached_thumbnail, load_cached_thumbnail, encode_thumbnail
+)
 from tagsense.data_structures.data_structure import DataStructure
 from tagsense.data_structures.manual_data_structure import ManualDataStructure
 
@@ -30,6 +33,14 @@ from tagsense.data_structures.manual_data_structure import ManualDataStructure
 logger = logging.getLogger(__name__)
 
 # **** CLASSES ****
+@dataclass(slots=True)
+class RelatedRecord:
+    """A parent or child of the viewed record, with the searches showing it and the process linking the two."""
+    data_structure: DataStructure
+    entry_key: str
+    searches: frozenset
+    process: Process
+
 class DataViewWindow(QMainWindow):
     """Window for viewing individual data records."""
     
@@ -40,7 +51,12 @@ class DataViewWindow(QMainWindow):
         # Store attributes
         self.current_search = current_search
         self.record_idx = record_idx
-        self.record = current_search.fetch_results()[record_idx]
+        # Paged through once per search; navigating between records only indexes into these
+        self._results = ResultPager(current_search)
+        self._results_search = current_search
+        self.record = self._results[record_idx]
+        # A record's parent never changes, so it is resolved once per record
+        self._parent_cache: Dict[Tuple[DataStructure, str], Optional[RelatedRecord]] = {}
         
         # ****
         # Initialize the UI
@@ -72,6 +88,7 @@ class DataViewWindow(QMainWindow):
         self._left_scroll_area.resizeEvent = resize_scroll_area_event
         self._left_scroll_area.setWidgetResizable(True)
         self._left_scroll_area.setWidget(self._left_sidebar_widget)
+        self._build_left_sidebar()
 
         # ****
         # Center container
@@ -79,11 +96,24 @@ class DataViewWindow(QMainWindow):
         self._center_scroll_area = QScrollArea()
         self._center_scroll_area.setWidgetResizable(True)
         self._center_scroll_area.setWidget(self._center_splitter)
+        self._build_center_container()
         
         self._main_widget.addWidget(self._left_scroll_area)
         self._main_widget.addWidget(self._center_scroll_area)
         QTimer.singleShot(0, self._set_splitter_sizes)
 
+        # Checkbox toggles restart this, so a burst of toggles rebuilds the center once
+        self._center_rebuild_timer = QTimer(self)
+        self._center_rebuild_timer.setSingleShot(True)
+        self._center_rebuild_timer.setInterval(16)  # About one frame
+        self._center_rebuild_timer.timeout.connect(self._populate_center_container)
+
+        # Navigation restarts this, so holding an arrow key only loads the record it stops on
+        self._navigation_timer = QTimer(self)
+        self._navigation_timer.setSingleShot(True)
+        self._navigation_timer.setInterval(30)
+        self._navigation_timer.timeout.connect(self._load_current_record)
+
     def _set_splitter_sizes(self):
         total_width = self._main_widget.width()
         left_width = int(total_width * 0.25)
@@ -104,340 +134,517 @@ class DataViewWindow(QMainWindow):
         """Moves to the previous record."""
         if self.record_idx > 0:
             self.record_idx -= 1
-            self.update_with_record(self.current_search, self.record_idx)
+            self._navigation_timer.start()
     
     def next_record(self) -> None:
         """Moves to the next record."""
-        if self.record_idx < len(self.current_search.fetch_results()) - 1:
+        if self.record_idx >= len(self._results) - 1:
+            self._results.refresh()  # Processes may have added records since the window opened
+        if self.record_idx < len(self._results) - 1:
             self.record_idx += 1
-            self.update_with_record(self.current_search, self.record_idx)
-
-    def _reset_left_sidebar(self):
-        # Remove and delete all items/widgets in the layout
-        while self._left_sidebar_layout.count():
-            item = self._left_sidebar_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-            else:
-                # If it’s not a widget, it could be a sub-layout
-                sub_layout = item.layout()
-                if sub_layout is not None:
-                    # Recursively clear sub-layout
-                    while sub_layout.count():
-                        sub_item = sub_layout.takeAt(0)
-                        sub_widget = sub_item.widget()
-                        if sub_widget is not None:
-                            sub_widget.deleteLater()
-        
-    def _populate_left_sidebar(self) -> None:
-        logger.debug("Resetting left sidebar...")
-        self._reset_left_sidebar()
-        logger.debug("Populating left sidebar...")
-        
-        # ****
-        # Add thumbnail
-        thumbnail = self.current_search.generate_thumbnail(self.record)
-        pixmap = QPixmap.fromImage(ImageQt.ImageQt(thumbnail))
+            self._navigation_timer.start()
 
-        # Create label
-        thumbnail_label = QLabel()
-        thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        thumbnail_label.setScaledContents(False)  # We'll scale manually to preserve aspect ratio
-        thumbnail_label.original_pixmap = pixmap  # Save original pixmap
+    def _load_current_record(self) -> None:
+        """Shows the record navigated to, counting the results again in case processes changed them."""
+        self._results.refresh()
+        self.record_idx = max(0, min(self.record_idx, len(self._results) - 1))
+        self.update_with_record(self.current_search, self.record_idx)
+
+    def _build_left_sidebar(self) -> None:
+        """Builds the sidebar widgets that are kept for every record."""
+        # ****
+        # Thumbnail
+        self._thumbnail_label = QLabel()
+        self._thumbnail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._thumbnail_label.setScaledContents(False)  # We'll scale manually to preserve aspect ratio
+        self._thumbnail_label.original_pixmap = QPixmap()  # Save original pixmap
+        self._thumbnail_shown_width = -1
+        self._thumbnail_smoothed: QPixmap = None  # Smoothly scaled pixmap, reused while the width is unchanged
+
+        # Rescaled once a resize settles rather than on every step of a drag
+        self._thumbnail_scale_timer = QTimer(self)
+        self._thumbnail_scale_timer.setSingleShot(True)
+        self._thumbnail_scale_timer.setInterval(120)
+        self._thumbnail_scale_timer.timeout.connect(self._scale_thumbnail_label)
 
         # Override resize event using a subclass or lambda
         def resize_event(event):
-            container_width = thumbnail_label.width()
-            original_pixmap = thumbnail_label.original_pixmap
-            scaled_pixmap = original_pixmap.scaledToWidth(container_width, Qt.TransformationMode.SmoothTransformation)
-            thumbnail_label.setPixmap(scaled_pixmap)
+            width = self._thumbnail_label.width()
+            if width != self._thumbnail_shown_width:
+                # Cheap nearest-neighbour preview until the smooth rescale
+                self._thumbnail_label.setPixmap(
+                    self._thumbnail_label.original_pixmap.scaledToWidth(width, Qt.TransformationMode.FastTransformation)
+                )
+                self._thumbnail_shown_width = width
+            self._thumbnail_scale_timer.start()
 
         # Dynamically bind the resizeEvent
-        thumbnail_label.resizeEvent = resize_event
+        self._thumbnail_label.resizeEvent = resize_event
+        self._left_sidebar_layout.addWidget(self._thumbnail_label)
 
-        # Add to layout
-        self._left_sidebar_layout.addWidget(thumbnail_label)
-        
         # ****
-        # Populate searches
-        self._searches = set()
-        self._search_checkboxes = []
-        
-        # Current search
-        self._searches.add(self.current_search)
+        # Checkbox sections; checkboxes are pooled by label and hidden while unused
+        self._search_checkbox_layout = QVBoxLayout()
+        self._data_structure_checkbox_layout = QVBoxLayout()
+        self._process_checkbox_layout = QVBoxLayout()
+        for title, layout in (
+            ("Searches:", self._search_checkbox_layout),
+            ("Data Structures:", self._data_structure_checkbox_layout),
+            ("Processes:", self._process_checkbox_layout),
+        ):
+            self._left_sidebar_layout.addWidget(QLabel(title))
+            self._left_sidebar_layout.addLayout(layout)
+        self._search_checkbox_pool: Dict[str, QCheckBox] = {}
+        self._data_structure_checkbox_pool: Dict[str, QCheckBox] = {}
+        self._process_checkbox_pool: Dict[str, QCheckBox] = {}
+        self._search_checkboxes: Dict[str, QCheckBox] = {}
+        self._data_structure_checkboxes: Dict[str, QCheckBox] = {}
+        self._process_checkboxes: Dict[str, QCheckBox] = {}
+
+        self._left_sidebar_layout.addStretch()
+
+    def _scale_thumbnail_label(self) -> None:
+        """Scales the sidebar thumbnail to the width of its label."""
+        self._thumbnail_scale_timer.stop()  # Any pending rescale is covered by this one
+        container_width = self._thumbnail_label.width()
+        if self._thumbnail_smoothed is None or self._thumbnail_smoothed_width != container_width:
+            original_pixmap = self._thumbnail_label.original_pixmap
+            self._thumbnail_smoothed = original_pixmap.scaledToWidth(
+                container_width, Qt.TransformationMode.SmoothTransformation
+            )
+            self._thumbnail_smoothed_width = container_width
+        self._thumbnail_label.setPixmap(self._thumbnail_smoothed)
+        self._thumbnail_shown_width = container_width
+
+    def _sync_checkboxes(
+        self,
+        layout: QVBoxLayout,
+        pool: Dict[str, QCheckBox],
+        targets: Dict[str, Any],
+        slot,
+    ) -> Dict[str, QCheckBox]:
+        """
+        Shows a checked checkbox for each label, reusing pooled checkboxes and hiding the rest.
+        Each shown checkbox keeps the object it stands for as `target`.
+
+        Args:
+            layout (QVBoxLayout): Layout of the checkbox section.
+            pool (Dict[str, QCheckBox]): Every checkbox made for the section, by label.
+            targets (Dict[str, Any]): Objects of the checkboxes to show, by label.
+            slot (Callable): Slot for new checkboxes' toggles.
+
+        Returns:
+            Dict[str, QCheckBox]: The shown checkboxes, by label.
+        """
+        shown = {}
+        for label, target in targets.items():
+            checkbox = pool.get(label)
+            if checkbox is None:
+                checkbox = pool[label] = QCheckBox(label)
+                checkbox.clicked.connect(slot)  # Only user toggles; resetting the state below emits nothing
+            checkbox.target = target
+            checkbox.setChecked(True)
+            shown[label] = checkbox
+
+        # Neighbouring records usually share their checkboxes, so the layout is only rebuilt when they differ
+        if [layout.itemAt(item_idx).widget() for item_idx in range(layout.count())] != list(shown.values()):
+            while layout.count():
+                layout.takeAt(0)
+            for checkbox in shown.values():
+                layout.addWidget(checkbox)
+
+        # Only checkboxes changing visibility are touched, as each change invalidates the layout
+        for label, checkbox in pool.items():
+            if checkbox.isHidden() == (label in shown):
+                checkbox.setVisible(label in shown)
+        return shown
+
+    def _populate_left_sidebar(self) -> None:
+        logger.debug("Populating left sidebar...")
         
-        # Related searches
-        for relation, data in self.related_data.items():
-            for search in data["searches"]:
-                self._searches.add(search)
+        # ****
+        # Update thumbnail
+        self._thumbnail_label.original_pixmap = self._load_thumbnail(self.record)
+        self._thumbnail_smoothed = None
+        self._scale_thumbnail_label()
         
-        self._left_sidebar_layout.addWidget(QLabel("Searches:"))
-        for search in self._searches:
-            search: Search
-            checkbox = QCheckBox(search.name)
-            checkbox.setChecked(True)
-            checkbox.stateChanged.connect(self._on_search_checkbox_toggled)
-            self._left_sidebar_layout.addWidget(checkbox)
-            self._search_checkboxes.append(checkbox)
+        # ****
+        # Populate searches: the current search plus every related record's searches.
+        # Kept as ordered lists so checkboxes keep a stable order between records
+        self._searches = list(dict.fromkeys([
+            self.current_search,
+            *(
+                search
+                for related_record in self.related_data
+                for search in sorted(related_record.searches, key=lambda search: search.name)
+            ),
+        ]))
+        self._search_checkboxes = self._sync_checkboxes(
+            self._search_checkbox_layout,
+            self._search_checkbox_pool,
+            {search.name: search for search in self._searches},
+            self._on_search_checkbox_toggled,
+        )
             
         # ****
         # Populate Data Structures
-        self._data_structures = set()
-        self._data_structure_checkboxes = []
-        for search in self._searches:
-            self._data_structures.add(search.data_structure)
-            
-        self._left_sidebar_layout.addWidget(QLabel("Data Structures:"))
-        for data_structure in self._data_structures:
-            data_structure: DataStructure
-            checkbox = QCheckBox(data_structure.uid)
-            checkbox.setChecked(True)
-            checkbox.stateChanged.connect(self._on_data_structure_checkbox_toggled)
-            self._left_sidebar_layout.addWidget(checkbox)
-            self._data_structure_checkboxes.append(checkbox)
+        self._data_structures = list(dict.fromkeys(search.data_structure for search in self._searches))
+        self._data_structure_checkboxes = self._sync_checkboxes(
+            self._data_structure_checkbox_layout,
+            self._data_structure_checkbox_pool,
+            {data_structure.uid: data_structure for data_structure in self._data_structures},
+            self._on_data_structure_checkbox_toggled,
+        )
             
         # ****
         # Populate Processes
-        self._processes = set()
-        self._process_checkboxes = []
-        for relation, data in self.related_data.items():
-            self._processes.add(data["process"])
-        
-        self._left_sidebar_layout.addWidget(QLabel("Processes:"))
-        for process in self._processes:
-            process: Process
-            checkbox = QCheckBox(process.uid)
-            checkbox.setChecked(True)
-            checkbox.stateChanged.connect(self._on_process_checkbox_toggled)
-            self._left_sidebar_layout.addWidget(checkbox)
-            self._process_checkboxes.append(checkbox)
-            
-        self._left_sidebar_layout.addStretch()
+        self._processes = list(dict.fromkeys(related_record.process for related_record in self.related_data))
+        self._process_checkboxes = self._sync_checkboxes(
+            self._process_checkbox_layout,
+            self._process_checkbox_pool,
+            {process.uid: process for process in self._processes},
+            self._on_process_checkbox_toggled,
+        )
+
+    def _load_thumbnail(self, record: dict) -> QPixmap:
+        """Returns the current search's thumbnail for a record, from the thumbnail cache when possible."""
+        cache_path = thumbnail_cache_path(self.current_search, record)
+        if cache_path:
+            cached_thumbnail = load_cached_thumbnail(cache_path)
+            if cached_thumbnail is not None:
+                return cached_thumbnail
+
+        # Handed to Qt as encoded bytes so the pixmap never shares PIL's buffer
+        pixmap = QPixmap()
+        thumbnail = self.current_search.generate_thumbnail(record)
+        if thumbnail is not None:
+            data = encode_thumbnail(thumbnail)
+            pixmap.loadFromData(data, "PNG")
+            if cache_path and not thumbnail.info.get("placeholder"):
+                try:
+                    store_cached_thumbnail(cache_path, data)
+                except OSError as e:
+                    logger.warning(f"Error caching thumbnail: {e}")
+        return pixmap
 
     def update_with_record(self, current_search: Search, record_idx: int) -> None:
         """Updates the window with a new record and search."""
         self.current_search = current_search
         self.record_idx = record_idx
-        self.record = current_search.fetch_results()[record_idx]
+        if current_search is not self._results_search:
+            self._results = ResultPager(current_search)
+            self._results_search = current_search
+        self.record = self._results[record_idx]
+        self._record_key = current_search.data_structure.fetch_entry_key_from_entry(self.record)
         
         # ****
         # Find parent & child records
 
-        # For every search, for every record, we need to record the related processes and data structures for sorting purposes
-        self.parent_data: list[dict] = {}
-        self.children_data: list[dict] = {}
-
-        # e.g.
-        # [
-        #     (DataStructure, record_key_01): {
-        #         "searches": {search_01, search_02},
-        #         "process": process,
-        #     }
-        # ]
-
-        # Flip search registry to be a dictionary of data structures to searches
-        data_structure_to_searches = {}
-        for search in registry.search_registry:
-            if search.data_structure not in data_structure_to_searches:
-                data_structure_to_searches[search.data_structure] = set()
-            data_structure_to_searches[search.data_structure].add(search)
-
-        # Find children
-        for process in registry.fetch_installed_processes():
-            # Filter any process that can't have the current record as input
-            if not process.input == current_search.data_structure:
-                continue
-            
+        # For every related record, we need to record the related processes and data structures for sorting purposes
+        self.parent_data: List[RelatedRecord] = []
+        self.children_data: List[RelatedRecord] = []
+
+        # Searches of each data structure, indexed by the registry as they are registered
+        data_structure_to_searches = registry.searches_by_data_structure
+
+        # Find children; only processes taking the current data structure as input can have any
+        candidate_processes = registry.processes_by_input.get(current_search.data_structure, frozenset())
+        installed_processes = registry.fetch_installed_processes() if candidate_processes else set()
+        output_to_processes: Dict[DataStructure, List[Process]] = {}
+        for process in candidate_processes & installed_processes:
+            output_to_processes.setdefault(process.output, []).append(process)
+
+        # One lookup per output data structure, however many processes write to it,
+        # so each data structure contributes at most one child
+        for output_data_structure, output_processes in output_to_processes.items():
             # Check if the output data structure contains a reference to the current record
-            output_data_structure = process.output
-            child = output_data_structure.read_by_input_key(
-                current_search.data_structure.fetch_entry_key_from_entry(self.record)
-            )
+            child = output_data_structure.read_by_input_keys([self._record_key]).get(self._record_key)
             if not child:
                 continue
             child = dict(child)
 
-            # Check if child record already exists
-            child_entry_key = output_data_structure.fetch_entry_key_from_entry(child)
-            if (output_data_structure, child_entry_key) in self.children_data:
-                raise ValueError("Child record already exists. Should not happen.")
+            # Credit the child to the process that created it
+            child_process_uid = output_data_structure.fetch_process_uid_from_entry(child)
+            process = next((p for p in output_processes if p.uid == child_process_uid), output_processes[0])
 
             # Add child record
-            self.children_data[(output_data_structure, child_entry_key)] = {
-                "searches": data_structure_to_searches[output_data_structure],
-                "process": process,
-            }
+            self.children_data.append(RelatedRecord(
+                data_structure=output_data_structure,
+                entry_key=output_data_structure.fetch_entry_key_from_entry(child),
+                searches=data_structure_to_searches[output_data_structure],
+                process=process,
+            ))
 
         # Find parent
-        parent_data_structure = registry.fetch_data_structure_by_uid(
-            current_search.data_structure.fetch_input_data_structure_uid_from_entry(self.record)
-        )
-        if parent_data_structure and not parent_data_structure.uid == ManualDataStructure.uid:
-            self.parent_data[
-                (
-                    parent_data_structure,
-                    current_search.data_structure.fetch_input_data_key_from_entry(self.record)
-                )
-                ] = {
-                    "searches": data_structure_to_searches[parent_data_structure],
-                    "process": registry.fetch_process_by_uid(
-                        current_search.data_structure.fetch_process_uid_from_entry(self.record),
-                    )
-                }
-            
-        # Create combined dictionary for sorting
-        self.related_data = {**self.parent_data, **self.children_data}
+        parent_cache_key = (current_search.data_structure, self._record_key)
+        if parent_cache_key in self._parent_cache:
+            parent = self._parent_cache[parent_cache_key]
+        else:
+            parent = self._parent_cache[parent_cache_key] = self._resolve_parent(current_search, self.record)
+        if parent:
+            self.parent_data.append(parent)
 
         # ****
-        self._populate_left_sidebar()
+        # The sidebar is painted once, after every section is updated
+        self._left_scroll_area.setUpdatesEnabled(False)
+        try:
+            self._populate_left_sidebar()
+        finally:
+            self._left_scroll_area.setUpdatesEnabled(True)
+        # A new record refreshes every pane, even one showing the same entries
+        self._pane_contents.clear()
         self._populate_center_container()
         
-    def _on_search_checkbox_toggled(self, state: int) -> None:
+    @property
+    def related_data(self) -> Iterator[RelatedRecord]:
+        """Iterates the parent records, then the child records."""
+        return itertools.chain(self.parent_data, self.children_data)
+
+    def _resolve_parent(self, current_search: Search, record: dict) -> Optional[RelatedRecord]:
+        """Returns the record a record was created from, unless it was entered manually."""
+        data_structure = current_search.data_structure
+        parent_data_structure = registry.fetch_data_structure_by_uid(
+            data_structure.fetch_input_data_structure_uid_from_entry(record)
+        )
+        if not parent_data_structure or parent_data_structure.uid == ManualDataStructure.uid:
+            return None
+        return RelatedRecord(
+            data_structure=parent_data_structure,
+            entry_key=data_structure.fetch_input_data_key_from_entry(record),
+            searches=registry.searches_by_data_structure[parent_data_structure],
+            process=registry.fetch_process_by_uid(data_structure.fetch_process_uid_from_entry(record)),
+        )
+
+    def _on_search_checkbox_toggled(self, checked: bool) -> None:
         logger.debug("Search checkbox toggled.")
-        self._populate_center_container()
+        self._center_rebuild_timer.start()
         
-    def _on_data_structure_checkbox_toggled(self, state: int) -> None:
+    def _on_data_structure_checkbox_toggled(self, checked: bool) -> None:
         logger.debug("Data structure checkbox toggled.")
-        self._populate_center_container()
+        self._center_rebuild_timer.start()
         
-    def _on_process_checkbox_toggled(self, state: int) -> None:
+    def _on_process_checkbox_toggled(self, checked: bool) -> None:
         logger.debug("Process checkbox toggled.")
-        self._populate_center_container()
+        self._center_rebuild_timer.start()
         
     def update_center_container(self, filtered_parents, filtered_children, current_search) -> None:
         """
         Updates the center container with filtered parent and child data along with the current search.
 
         Args:
-            filtered_parents (dict): Filtered parent data in the format {parent_key: {"searches": set}}.
-            filtered_children (dict): Filtered child data in the format {child_key: {"searches": set}}.
+            filtered_parents (List[RelatedRecord]): Parent records to filter and show.
+            filtered_children (List[RelatedRecord]): Child records to filter and show.
             current_search (str): The current search to display.
         """
         logger.debug("Updating center container...")
-
-        # Clear existing widgets from the layout
-        while self._center_splitter.count():
-            widget = self._center_splitter.widget(0)
-            self._center_splitter.widget(0).setParent(None)
-            widget.deleteLater()
                 
         # ****
         # Filter records based on checkboxes
-        valid_data_structures = set()
-        valid_searches = set()
-        valid_processes = set()
-        
-        for checkbox in self._data_structure_checkboxes:
-            if checkbox.isChecked():
-                valid_data_structures.add(
-                    registry.fetch_data_structure_by_uid(checkbox.text())
-                )
-        
-        for checkbox in self._search_checkboxes:
-            if checkbox.isChecked():
-                valid_searches.add(
-                    registry.fetch_search_by_name(checkbox.text())
-                )
-
-        for checkbox in self._process_checkboxes:
-            if checkbox.isChecked():
-                valid_processes.add(
-                    registry.fetch_process_by_uid(checkbox.text())
-                )
+        # Each checkbox carries the object it stands for
+        valid_data_structures = {
+            checkbox.target for checkbox in self._data_structure_checkboxes.values() if checkbox.isChecked()
+        }
+        valid_searches = {checkbox.target for checkbox in self._search_checkboxes.values() if checkbox.isChecked()}
+        valid_processes = {checkbox.target for checkbox in self._process_checkboxes.values() if checkbox.isChecked()}
                 
         filtered_parents = self.filter_records(filtered_parents, valid_data_structures, valid_searches, valid_processes)
         filtered_children = self.filter_records(filtered_children, valid_data_structures, valid_searches, valid_processes)
-        parent_entry_keys = [key for _, key in filtered_parents.keys()]
-        child_entry_keys = [key for _, key in filtered_children.keys()]
+        parent_entry_keys = [record.entry_key for record in filtered_parents]
+        child_entry_keys = [record.entry_key for record in filtered_children]
 
         # ****
         # Populate current search section
-        current_search_widget = CustomGridTableWidget(
-            [current_search], 
-            parent=self, 
-            window_class=self.__class__,
-            entry_whitelist=self.current_search.data_structure.fetch_entry_key_from_entry(self.record)
+        current_entry_whitelist = [self._record_key]
+        if self._current_search_widget is None:
+            self._current_search_widget = CustomGridTableWidget(
+                [current_search], 
+                parent=self, 
+                window_class=self.__class__,
+                entry_whitelist=current_entry_whitelist
+                )
+            self._center_splitter.insertWidget(0, self._current_search_widget)
+            self._pane_contents[self._current_search_widget] = (current_search, self._record_key)
+        else:
+            self._update_pane(
+                self._current_search_widget,
+                (current_search, self._record_key),
+                lambda: self._current_search_widget.set_searches(
+                    [current_search], entry_whitelist=current_entry_whitelist
+                ),
             )
-        self._center_splitter.addWidget(current_search_widget)
 
         # ****
         # Populate parent section
-        parent_widget_container = QWidget()
-        parent_widget_container.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        parent_widget_container_layout = QVBoxLayout(parent_widget_container)
-
-        if parent_entry_keys:
-            parents_label = QLabel("Parents:")
-            parent_widget_container_layout.addWidget(parents_label)
-        if filtered_parents:
-            for (parent_ds, parent_entry_key), data in filtered_parents.items():
-                parent_widget = CustomGridTableWidget(
-                    list(data["searches"]),
-                    parent=self,
-                    window_class=self.__class__,
-                    entry_whitelist=parent_entry_keys
-                )
-                parent_widget_container_layout.addWidget(parent_widget)
-
-        self._center_splitter.addWidget(parent_widget_container)
+        def update_parents():
+            self._parents_label.setVisible(bool(parent_entry_keys))
+            self._sync_grid_widgets(
+                self._parent_widget_container_layout,
+                self._parent_widgets,
+                [list(record.searches) for record in filtered_parents],
+                parent_entry_keys,
+            )
+        self._update_pane(self._parent_widget_container, filtered_parents, update_parents)
 
         # ****
         # Populate children section
-        children_widget_container = QWidget()
-        children_widget_container.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
-        children_widget_container_layout = QVBoxLayout(children_widget_container)
-
-        if child_entry_keys:
-            children_label = QLabel("Children:")
-            children_widget_container_layout.addWidget(children_label)
-        for (child_ds, child_entry_key), data in filtered_children.items():
-            child_widget = CustomGridTableWidget(
-                list(data["searches"]),
-                parent=self,
-                window_class=self.__class__,
-                entry_whitelist=child_entry_keys
+        def update_children():
+            self._children_label.setVisible(bool(child_entry_keys))
+            self._sync_grid_widgets(
+                self._children_widget_container_layout,
+                self._child_widgets,
+                [list(record.searches) for record in filtered_children],
+                child_entry_keys,
             )
-            children_widget_container_layout.addWidget(child_widget)
+        self._update_pane(self._children_widget_container, filtered_children, update_children)
 
+    def _update_pane(self, pane: QWidget, content: Any, update: Callable[[], None]) -> None:
+        """
+        Applies an update to a center pane now, or once it comes into view if it is collapsed or scrolled away.
+
+        Args:
+            pane (QWidget): Center pane to update.
+            content (Any): What the pane shows after the update; a pane already showing it is left alone.
+            update (Callable[[], None]): Refreshes the pane.
+        """
+        if self._pane_contents.get(pane) == content:
+            # A filter change that did not touch this pane
+            self._pending_pane_updates.pop(pane, None)
+            return
+
+        def apply_update():
+            update()
+            self._pane_contents[pane] = content
+
+        if pane in self._hidden_panes:
+            self._pending_pane_updates[pane] = apply_update  # Only the latest update matters
+        else:
+            self._pending_pane_updates.pop(pane, None)
+            apply_update()
+
+    def _on_center_splitter_moved(self, pos: int, index: int) -> None:
+        self._refresh_hidden_panes()
+
+    def _on_center_scrolled(self, value: int) -> None:
+        self._refresh_hidden_panes()
+
+    def _on_center_scroll_range_changed(self, minimum: int, maximum: int) -> None:
+        # The range changes before the panes are moved, so their new positions are checked afterwards
+        QTimer.singleShot(0, self._refresh_hidden_panes)
+
+    def _panes_out_of_view(self) -> Set[QWidget]:
+        """Returns the center panes that are collapsed or scrolled outside the center scroll area."""
+        viewport = self._center_scroll_area.viewport()
+        panes = set()
+        for pane_idx, size in enumerate(self._center_splitter.sizes()):
+            pane = self._center_splitter.widget(pane_idx)
+            pane_rect = QRect(pane.mapTo(viewport, QPoint(0, 0)), pane.size())
+            if size == 0 or not viewport.rect().intersects(pane_rect):
+                panes.add(pane)
+        return panes
+
+    def _refresh_hidden_panes(self) -> None:
+        """Tracks the center panes out of view and applies updates held back while a pane was out of view."""
+        self._hidden_panes = self._panes_out_of_view()
+        for pane in list(self._pending_pane_updates):
+            if pane not in self._hidden_panes:
+                self._pending_pane_updates.pop(pane)()
+
+    def _build_center_container(self) -> None:
+        """Builds the center sections that are kept for every record; the current search widget follows on first update."""
+        self._current_search_widget: CustomGridTableWidget = None
+
+        # Panes the user collapses or scrolls away from are not refreshed until they are in view again
+        self._hidden_panes: Set[QWidget] = set()
+        self._pending_pane_updates: Dict[QWidget, Callable[[], None]] = {}
+        # What each pane last showed, so filter changes only refresh the panes they affect
+        self._pane_contents: Dict[QWidget, Any] = {}
+        self._center_splitter.splitterMoved.connect(self._on_center_splitter_moved)
+        center_scroll_bar = self._center_scroll_area.verticalScrollBar()
+        center_scroll_bar.valueChanged.connect(self._on_center_scrolled)
+        center_scroll_bar.rangeChanged.connect(self._on_center_scroll_range_changed)
+
+        # Parent section
+        self._parent_widget_container = parent_widget_container = QWidget()
+        parent_widget_container.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._parent_widget_container_layout = QVBoxLayout(parent_widget_container)
+        self._parents_label = QLabel("Parents:")
+        self._parent_widget_container_layout.addWidget(self._parents_label)
+        self._parent_widgets: List[CustomGridTableWidget] = []
+        self._center_splitter.addWidget(parent_widget_container)
+
+        # Children section
+        self._children_widget_container = children_widget_container = QWidget()
+        children_widget_container.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._children_widget_container_layout = QVBoxLayout(children_widget_container)
+        self._children_label = QLabel("Children:")
+        self._children_widget_container_layout.addWidget(self._children_label)
+        self._child_widgets: List[CustomGridTableWidget] = []
         self._center_splitter.addWidget(children_widget_container)
+
+    def _sync_grid_widgets(
+        self,
+        layout: QVBoxLayout,
+        pool: List[CustomGridTableWidget],
+        search_lists: List[List[Search]],
+        entry_whitelist: List[str],
+    ) -> None:
+        """
+        Shows a result widget per list of searches, reusing pooled widgets and hiding the rest.
+
+        Args:
+            layout (QVBoxLayout): Layout of the section.
+            pool (List[CustomGridTableWidget]): Every result widget made for the section.
+            search_lists (List[List[Search]]): Searches of each widget to show.
+            entry_whitelist (List[str]): Entry whitelist for every shown widget.
+        """
+        for widget_idx, searches in enumerate(search_lists):
+            if widget_idx < len(pool):
+                pool[widget_idx].set_searches(searches, entry_whitelist=entry_whitelist)
+                pool[widget_idx].show()
+            else:
+                widget = CustomGridTableWidget(
+                    searches,
+                    parent=self,
+                    window_class=self.__class__,
+                    entry_whitelist=entry_whitelist
+                )
+                layout.addWidget(widget)
+                pool.append(widget)
+        for widget in pool[len(search_lists):]:
+            widget.hide()
             
     def _populate_center_container(self) -> None:
         logger.debug("Populating center container...")
-        self.update_center_container(self.parent_data, self.children_data, self.current_search)
+        self._center_rebuild_timer.stop()  # Any pending rebuild is covered by this one
+        # Rebuilt sections are painted once, after every table in them is populated
+        self._center_scroll_area.setUpdatesEnabled(False)
+        self._hidden_panes = self._panes_out_of_view()
+        try:
+            self.update_center_container(self.parent_data, self.children_data, self.current_search)
+        finally:
+            self._center_scroll_area.setUpdatesEnabled(True)
 
     def filter_records(self, records, valid_data_structures, valid_searches, valid_processes):
         """
         Filters records based on valid data structures, searches, and processes.
 
         Args:
-            records (list): A list of records to filter following the format of `self.related_data`.
+            records (List[RelatedRecord]): Related records to filter.
             valid_data_structures (set): A set of allowed data structures.
             valid_searches (set): A set of allowed searches.
             valid_processes (set): A set of allowed processes.
 
         Returns:
-            dict: A dictionary of filtered records.
+            List[RelatedRecord]: The records passing every filter.
         """
-        filtered_records = {}
-
-        for (data_structure, record_key), record_data in records.items():
-            # Check if the data structure is valid
-            if data_structure not in valid_data_structures:
-                continue
-
-            # Check if any of the searches are valid
-            if not record_data["searches"].intersection(valid_searches):
-                continue
-
-            # Check if the process is valid
-            if record_data["process"] not in valid_processes:
-                continue
-
-            # If all conditions are met, keep the record
-            filtered_records[(data_structure, record_key)] = record_data
-
-        return filtered_records
+        # A record is kept if its data structure and process are valid and any of its searches is
+        return [
+            record
+            for record in records
+            if record.data_structure in valid_data_structures
+            and record.process in valid_processes
+            and not valid_searches.isdisjoint(record.searches)
+        ]
 
 class FocusableWidget(QWidget):
     """A widget that can receive focus."""
@@ -7,16 +7,15 @@ Dialog window for running processes.
 # **** IMPORTS ****
 import logging
 from typing import List
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QModelIndex
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QWidget, QLabel, 
 )
-from PyQt6.QtWidgets import QListWidgetItem
-from PyQt6.QtWidgets import QTableWidgetItem
 from PyQt6.QtWidgets import QComboBox
 from PyQt6.QtWidgets import QAbstractItemView
 
 from tagsense import registry
+from tagsense.util import get_row_data
 from tagsense.data_structures.data_structure import DataStructure
 from tagsense.widgets import CustomGridTableWidget, RunProcessesWidget
 
@@ -103,10 +102,7 @@ class RunProcesses(QDialog):
         data_structure: DataStructure = self.data_structure_dropdown.itemData(index, Qt.ItemDataRole.UserRole)
         
         # Filter the searches for the selected data structure
-        self.searches = [
-            search for search in registry.search_registry
-            if search.data_structure.uid == data_structure.uid
-        ]
+        self.searches = list(registry.searches_by_data_structure.get(data_structure, frozenset()))
         
         # Create a new selection widget
         self.selection_widget = SelectionGridTableWidget(
@@ -121,8 +117,8 @@ class RunProcesses(QDialog):
         
         # Identify processes that can take the selected data structure
         processes = [
-            proc for proc in self.processes
-            if proc.input.uid == data_structure.uid
+            proc for proc in registry.processes_by_input.get(data_structure, frozenset())
+            if proc in self.processes
         ]
 
         if not processes:
@@ -161,18 +157,18 @@ class SelectionGridTableWidget(CustomGridTableWidget):
 
         # ****
         # Allow row selection
-        self.table_widget.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.table_widget.itemClicked.connect(self.handle_table_item_click)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.table_view.clicked.connect(self.handle_table_item_click)
 
         self.grid_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.grid_widget.itemClicked.connect(self.handle_grid_item_click)
+        self.grid_widget.clicked.connect(self.handle_grid_item_click)
 
         self._selected_records = []
         
-    def handle_table_item_click(self, item: QTableWidgetItem) -> None:
-        row_idx = item.row()
-        record = self.get_row_data(self.table_widget, row_idx)
+    def handle_table_item_click(self, index: QModelIndex) -> None:
+        row_idx = index.row()
+        record = get_row_data(self.table_view, row_idx)
 
         # Add/remove from _selected_records
         if record in self._selected_records:
@@ -180,9 +176,9 @@ class SelectionGridTableWidget(CustomGridTableWidget):
         else:
             self._selected_records.append(record)
             
-    def handle_grid_item_click(self, item: QListWidgetItem) -> None:
-        row_idx = self.grid_widget.row(item)
-        record = self.get_row_data(self.table_widget, row_idx)
+    def handle_grid_item_click(self, index: QModelIndex) -> None:
+        row_idx = index.row()
+        record = get_row_data(self.table_view, row_idx)
 
         # Add/remove from _selected_records
         if record in self._selected_records:
@@ -39,6 +39,9 @@ from tagsense.views.dialog_windows.install_processes import InstallProcessesDial
 # **** LOGGING ****
 logger = logging.getLogger(__name__)
 
+# **** CONSTANTS ****
+PARENTHESES_TOKEN_PATTERN = re.compile(r"-?\(|\)|[^\s()]+")
+
 # **** CLASSES ****
 class MainWindow(QMainWindow):
     """
@@ -196,22 +199,6 @@ class MainWindow(QMainWindow):
         self._cache_all_explicit_data_items(self.data_view.current_search)
         self._update_suggestions("")  # Initial suggestions
         
-    def get_row_data(table_widget: QTableWidget, row_idx: int) -> dict[str, str]:
-        """
-        Fetches all data in a given row of a QTableWidget as a dictionary.
-
-        Args:
-            table_widget (QTableWidget): The table widget.
-            row_idx (int): The row index.
-
-        Returns:
-            dict[str, str]: A dictionary mapping column headers to cell values.
-        """
-        headers = [table_widget.horizontalHeaderItem(col).text() for col in range(table_widget.columnCount())]
-        values = [table_widget.item(row_idx, col).text() if table_widget.item(row_idx, col) else "" 
-                for col in range(table_widget.columnCount())]
-        return dict(zip(headers, values))
-
     def _cache_all_explicit_data_items(self, search: AppSearch) -> None:
         """Cache all explicit data items for suggestions."""
         self.all_items = search.generate_all_possible_tags()
@@ -468,27 +455,32 @@ def expand_parentheses(expr: str) -> str:
         >>> expand_parentheses("-(101 or -102)")
         '-101 or 102'
     """
-    pattern = re.compile(r'(?P<neg>-?)\(\s*(?P<body>[^)]+)\s*\)')
-    while True:
-        match = pattern.search(expr)
-        if not match:
-            break
-        is_negative = (match.group('neg') == '-')
-        contents = match.group('body')
-        tokens = contents.strip().split()
-
-        expanded_tokens = []
-        for t in tokens:
-            if t.lower() in ('and', 'or'):
-                expanded_tokens.append(t)
-            elif is_negative:
-                expanded_tokens.append(t[1:] if t.startswith('-') else f'-{t}')
-            else:
-                expanded_tokens.append(t)
-        replacement = " ".join(expanded_tokens)
-        start, end = match.span()
-        expr = expr[:start] + replacement + expr[end:]
-    return expr
+    # Single pass over the tokens; each stack frame holds a group's tokens and its negation flag
+    stack: List[Tuple[List[str], bool]] = [([], False)]
+    for token in PARENTHESES_TOKEN_PATTERN.findall(expr):
+        if token.endswith('('):
+            stack.append(([], token == '-('))
+        elif token == ')' and len(stack) > 1:
+            tokens, is_negative = stack.pop()
+            if is_negative:
+                tokens = [
+                    t if t.lower() in ('and', 'or') else (t[1:] if t.startswith('-') else f'-{t}')
+                    for t in tokens
+                ]
+            stack[-1][0].extend(tokens)
+        else:
+            stack[-1][0].append(token)
+
+    # Unclosed groups are kept as-is
+    while len(stack) > 1:
+        tokens, is_negative = stack.pop()
+        opener = '-(' if is_negative else '('
+        if tokens:
+            tokens[0] = opener + tokens[0]
+        else:
+            tokens = [opener]
+        stack[-1][0].extend(tokens)
+    return " ".join(stack[0][0])
 
 
 def parse_logical_expression(expr: str) -> Tuple[List[str], List[str]]:
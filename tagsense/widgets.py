@@ -12,30 +12,233 @@ import time
 import select
 import threading
 import logging
+import hashlib
 import contextlib
 import traceback
-from PIL import ImageQt
+from pathlib import Path
+from functools import lru_cache
 from typing import List, Optional, Any, Dict, Tuple
 
-from PyQt6.QtGui import QPixmap, QIcon
-from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QSize, QObject, QThread
+from PIL import Image
+from PIL.Image import Image as PILImage
+from PyQt6.QtGui import QPixmap, QIcon, QPainter
+from PyQt6.QtCore import (
+    pyqtSignal, Qt, QTimer, QSize, QObject, QThread, QAbstractTableModel, QAbstractListModel, QModelIndex, QRunnable,
+    QThreadPool, QRect
+)
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QComboBox, QPushButton,
-    QTableWidget, QStackedWidget, QListWidget, QTableWidgetItem, QLabel,
-    QHeaderView, QAbstractItemView, QListWidgetItem, QGroupBox, QPlainTextEdit,
-    QScrollArea, QCheckBox, QLineEdit, QDialog, QMessageBox
+    QTableView, QStackedWidget, QListView, QLabel,
+    QHeaderView, QAbstractItemView, QGroupBox, QPlainTextEdit,
+    QScrollArea, QCheckBox, QLineEdit, QDialog, QMessageBox, QStyledItemDelegate, QStyleOptionViewItem,
+    QStyle, QApplication
 )
 
 # **** LOCAL IMPORTS ****
 from tagsense.util import create_divider
+from tagsense.config import THUMBNAIL_CACHE_DIR
 from tagsense.searches.search import Search
 
 # **** LOGGING ****
 logger = logging.getLogger(__name__)
 
+# **** CONSTANTS ****
+THUMBNAIL_MAX_SIZE = (512, 512)  # Larger than any view shows a thumbnail
+
 # **** CLASSES ****
+class SearchResultsTableModel(QAbstractTableModel):
+    """
+    Table model serving search results to a view on demand.
+    Only the rows Qt actually paints are converted to text, once each.
+    """
+    preview_column: str = "preview"
+    preview_changed: pyqtSignal = pyqtSignal(int)  # row index
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._records: List[dict] = []
+        self._columns: List[str] = []
+        self._previews: Dict[int, QPixmap] = {}
+        self._row_text: Dict[int, List[str]] = {}
+
+    def set_records(self, records: List[dict], columns: List[str]) -> None:
+        """Replaces the records and columns shown by the model."""
+        self.beginResetModel()
+        self._records = records
+        self._columns = columns
+        self._previews = {}
+        self._row_text = {}
+        self.endResetModel()
+
+    def preview(self, row_idx: int) -> Optional[QPixmap]:
+        """Returns the preview image set for a row, if any."""
+        return self._previews.get(row_idx)
+
+    def set_preview(self, row_idx: int, pixmap: QPixmap) -> None:
+        """Sets the preview image shown for a row."""
+        self._previews[row_idx] = pixmap
+        if self.preview_column in self._columns:
+            index = self.index(row_idx, self._columns.index(self.preview_column))
+            self.dataChanged.emit(index, index)
+        self.preview_changed.emit(row_idx)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        # Views ask for many roles per cell; only these two carry anything
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole):
+            return None
+        row_idx = index.row()
+        column = self._columns[index.column()]
+        if column == self.preview_column:
+            pixmap = self._previews.get(row_idx)
+            if role == Qt.ItemDataRole.DecorationRole and pixmap is not None and not pixmap.isNull():
+                return pixmap
+            if role == Qt.ItemDataRole.DisplayRole and pixmap is not None and pixmap.isNull():
+                return "No file preview"
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._text_for_row(row_idx)[index.column()]
+        return None
+
+    def _text_for_row(self, row_idx: int) -> List[str]:
+        """Returns the display text of every column in a row, stringifying it on first use."""
+        row_text = self._row_text.get(row_idx)
+        if row_text is None:
+            get = self._records[row_idx].get
+            row_text = self._row_text[row_idx] = [str(get(column, "")) for column in self._columns]
+        return row_text
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return super().headerData(section, orientation, role)
+
+class SearchResultsGridModel(QAbstractListModel):
+    """
+    List model serving one thumbnail cell per row of a SearchResultsTableModel.
+    Previews are read from the table model, so both views share one copy of each image.
+    """
+
+    def __init__(self, source: SearchResultsTableModel, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._source = source
+        self._icons: Dict[int, QIcon] = {}
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self._handle_source_reset)
+        source.preview_changed.connect(self._handle_preview_changed)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._source.rowCount()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row_idx = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            pixmap = self._source.preview(row_idx)
+            if pixmap is not None and pixmap.isNull():
+                return f"idx: {row_idx}\nNo thumbnail"
+            return f"idx: {row_idx}"
+        if role == Qt.ItemDataRole.DecorationRole:
+            # An icon, unlike a pixmap, is drawn at the view's icon size
+            icon = self._icons.get(row_idx)
+            if icon is None:
+                pixmap = self._source.preview(row_idx)
+                if pixmap is None or pixmap.isNull():
+                    return None
+                icon = self._icons[row_idx] = QIcon(pixmap)
+            return icon
+        return None
+
+    def _handle_source_reset(self) -> None:
+        self._icons = {}
+        self.endResetModel()
+
+    def _handle_preview_changed(self, row_idx: int) -> None:
+        self._icons.pop(row_idx, None)
+        index = self.index(row_idx)
+        self.dataChanged.emit(index, index)
+
+class PixmapDelegate(QStyledItemDelegate):
+    """
+    Paints a cell's DecorationRole pixmap scaled to fit the cell, keeping its aspect ratio.
+    Scaling happens at paint time, so only one full-size pixmap is kept per row.
+    """
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if not isinstance(pixmap, QPixmap) or pixmap.isNull():
+            super().paint(painter, option, index)
+            return
+
+        # Background and selection state without the default icon
+        item_option = QStyleOptionViewItem(option)
+        self.initStyleOption(item_option, index)
+        item_option.icon = QIcon()
+        item_option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, item_option, painter, option.widget)
+
+        # Pixmap scaled into the cell, left aligned and vertically centered
+        target_size = pixmap.size().scaled(option.rect.size(), Qt.AspectRatioMode.KeepAspectRatio)
+        target_rect = QRect(option.rect.topLeft(), target_size)
+        target_rect.moveTop(option.rect.top() + (option.rect.height() - target_size.height()) // 2)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmap(target_rect, pixmap)
+        painter.restore()
+
+class ThumbnailSignals(QObject):
+    """Signals for thumbnail tasks, as a QRunnable cannot emit signals itself."""
+    thumbnail_ready = pyqtSignal(int, int, bytes)  # generation, row index, PNG data
+
+class ThumbnailTask(QRunnable):
+    """
+    Generates a thumbnail off the GUI thread and stores it in the thumbnail cache.
+    The image is handed back as PNG data, as pixmaps may only be created on the GUI thread.
+    """
+
+    def __init__(
+        self,
+        search: Search,
+        record: dict,
+        row_idx: int,
+        generation: int,
+        cache_path: Optional[Path],
+        signals: ThumbnailSignals,
+    ) -> None:
+        super().__init__()
+        self.search = search
+        self.record = record
+        self.row_idx = row_idx
+        self.generation = generation
+        self.cache_path = cache_path
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            thumbnail = self.search.generate_thumbnail(self.record)
+            data = encode_thumbnail(thumbnail)
+            # Placeholders stand in for images that could not be made, which may succeed next time
+            if self.cache_path and not thumbnail.info.get("placeholder"):
+                store_cached_thumbnail(self.cache_path, data)
+        except Exception as e:
+            logger.warning(f"Error generating thumbnail for row {self.row_idx}: {e}")
+            data = b""
+
+        try:
+            self.signals.thumbnail_ready.emit(self.generation, self.row_idx, data)
+        except RuntimeError:
+            pass  # Receiver was deleted while the thumbnail was generating
+
 class CustomGridTableWidget(QWidget):
     search_dropdown_changed: pyqtSignal = pyqtSignal(object)
+    thumbnail_lookahead: int = 5  # Rows past each edge of the viewport to load early
     
     def __init__(
         self, 
@@ -61,6 +264,13 @@ class CustomGridTableWidget(QWidget):
         self.entry_blacklist = entry_blacklist
         self._detail_windows = []  # Keep references to avoid segfaults
         
+        # Thumbnails are generated on a thread pool; stale results are dropped by generation
+        self._thumbnail_generation = 0
+        self._thumbnails_requested: set[int] = set()
+        self.results: List[dict] = []
+        self._thumbnail_signals = ThumbnailSignals()
+        self._thumbnail_signals.thumbnail_ready.connect(self._handle_thumbnail_ready)
+        
         # Initialize the UI
         main_layout = QVBoxLayout(self)
         self.setLayout(main_layout)
@@ -73,9 +283,7 @@ class CustomGridTableWidget(QWidget):
         # *
         # Left controls
         self.search_dropdown = QComboBox()
-        for index, search in enumerate(self.searches):
-            self.search_dropdown.addItem(search.name)
-            self.search_dropdown.setItemData(index, search, Qt.ItemDataRole.UserRole)
+        self._populate_search_dropdown()
         self.search_dropdown.currentIndexChanged.connect(self.handle_search_dropdown_change)
 
         self.info_button = QPushButton("Info")
@@ -106,16 +314,21 @@ class CustomGridTableWidget(QWidget):
         self.data_view = QStackedWidget()
 
         # *
-        # Table widget
-        self.table_widget = QTableWidget()
-        self.table_widget.itemDoubleClicked.connect(self.handle_table_item_double_click)
-        self.table_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.data_view.addWidget(self.table_widget)
+        # Table view
+        self.table_model = SearchResultsTableModel(self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.table_model)
+        self.table_view.setItemDelegate(PixmapDelegate(self.table_view))
+        self.table_view.doubleClicked.connect(self.handle_table_item_double_click)
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.data_view.addWidget(self.table_view)
 
         # *
-        # Grid widget
-        self.grid_widget = QListWidget()
+        # Grid view; cells are served by the model, so none are built up front
+        self.grid_model = SearchResultsGridModel(self.table_model, self)
+        self.grid_widget = QListView()
+        self.grid_widget.setModel(self.grid_model)
         self.grid_widget.setViewMode(self.grid_widget.ViewMode.IconMode)
         self.grid_widget.setFlow(self.grid_widget.Flow.LeftToRight)
         self.grid_widget.setResizeMode(self.grid_widget.ResizeMode.Adjust)
@@ -123,15 +336,26 @@ class CustomGridTableWidget(QWidget):
         self.grid_widget.setGridSize(QSize(150, 150))
         self.grid_widget.setDragEnabled(False)
         self.grid_widget.setMovement(self.grid_widget.Movement.Static)
-        self.grid_widget.itemDoubleClicked.connect(self.handle_grid_item_double_click)
+        self.grid_widget.setUniformItemSizes(True)  # Every cell is the grid size, so skip measuring each
+        self.grid_widget.doubleClicked.connect(self.handle_grid_item_double_click)
         self.data_view.addWidget(self.grid_widget)
 
+        # Thumbnails are only loaded for rows scrolled into view
+        self.table_view.verticalScrollBar().valueChanged.connect(self._ensure_thumbnails_for_viewport)
+        self.grid_widget.verticalScrollBar().valueChanged.connect(self._ensure_thumbnails_for_viewport)
+        self.data_view.currentChanged.connect(self._ensure_thumbnails_for_viewport)
+
         main_layout.addLayout(top_controls_layout)
         main_layout.addWidget(self.data_view)
 
         self.current_search: Search = next(iter(self.searches), None)
         self.populate_data_view()
 
+    def resizeEvent(self, event) -> None:
+        """Loads thumbnails for rows uncovered by a larger viewport."""
+        super().resizeEvent(event)
+        self._ensure_thumbnails_for_viewport()
+
     def switch_to_table_view(self) -> None:
         """Switches the stacked widget to show the table view. """
         self.data_view.setCurrentIndex(0)
@@ -140,15 +364,51 @@ class CustomGridTableWidget(QWidget):
         """Switches the stacked widget to show the thumbnail (grid) view. """
         self.data_view.setCurrentIndex(1)
 
+    def _populate_search_dropdown(self) -> None:
+        """Fills the search dropdown with the widget's searches."""
+        self.search_dropdown.clear()
+        for index, search in enumerate(self.searches):
+            self.search_dropdown.addItem(search.name)
+            self.search_dropdown.setItemData(index, search, Qt.ItemDataRole.UserRole)
+
+    def set_searches(
+        self,
+        searches: list,
+        entry_whitelist: Optional[list] = None,
+        entry_blacklist: Optional[list] = None
+        ) -> None:
+        """Shows a new set of searches, reusing the widget rather than building another.
+
+        Args:
+            searches (list): List of searches to display.
+            entry_whitelist (Optional[list], optional): Entry whitelist for every search in widget. Defaults to None.
+            entry_blacklist (Optional[list], optional): Entry blacklist for every search in widget. Defaults to None.
+        """
+        self.searches = searches
+        self.entry_whitelist = entry_whitelist
+        self.entry_blacklist = entry_blacklist
+
+        # Refilling the dropdown is not a user selecting a search
+        self.search_dropdown.blockSignals(True)
+        try:
+            self._populate_search_dropdown()
+        finally:
+            self.search_dropdown.blockSignals(False)
+
+        self.current_search = next(iter(self.searches), None)
+        if not self.current_search:
+            self.results = []
+            self.table_model.set_records([], [])
+        self.populate_data_view()
+
     def populate_data_view(self) -> None:
         if not self.current_search:
             return
 
         # ****
-        # Reset table and grid
-        self.grid_widget.clear()
-        self.table_widget.clear()
-        self.table_widget.setRowCount(0)
+        # Drop any thumbnails still being generated for the previous results
+        self._thumbnail_generation += 1
+        self._thumbnails_requested.clear()
 
         # ****
         # Fetch results
@@ -157,77 +417,114 @@ class CustomGridTableWidget(QWidget):
         # ****
         # Check if there are any results
         if not self.results:
-            self.table_widget.setColumnCount(0)
+            self.table_model.set_records([], [])
             return
-        for item in self.results:  # Add preview key to each item
-            item["preview"] = ""
 
         # ****
-        # Prepare table
-        columns = list(self.results[0].keys())
-        self.table_widget.setColumnCount(len(columns))
-        self.table_widget.setHorizontalHeaderLabels(columns)
-        self.table_widget.horizontalHeader().setStretchLastSection(True)
+        # Prepare table; the preview column is served by the model, not the records
+        columns = list(self.results[0])
+        if SearchResultsTableModel.preview_column not in columns:
+            columns.append(SearchResultsTableModel.preview_column)
+        self.table_model.set_records(self.results, columns)
+        header = self.table_view.horizontalHeader()
+        header.setStretchLastSection(True)
 
         # Allow user to resize columns manually but also stretch the last one
+        last_col_idx = len(columns) - 1
         for col_idx in range(len(columns)):
-            self.table_widget.horizontalHeader().setSectionResizeMode(
+            header.setSectionResizeMode(
                 col_idx,
-                QHeaderView.ResizeMode.Interactive if col_idx < len(columns)-1
+                QHeaderView.ResizeMode.Interactive if col_idx < last_col_idx
                 else QHeaderView.ResizeMode.Stretch
             )
-        self.table_widget.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         # ****
         # Populate data view
-        for row_idx, record in enumerate(self.results):
-            # ****
-            # Table view
-            self.table_widget.insertRow(row_idx)
-            for col_idx, col_key in enumerate(columns):
-                item_value = str(record.get(col_key, ""))
-                self.table_widget.setItem(row_idx, col_idx, QTableWidgetItem(item_value))
-
-            # ****
-            # Grid view
-            pixmap = QPixmap.fromImage(ImageQt.ImageQt(self.current_search.generate_thumbnail(record)))
-            thumbnail_item = QListWidgetItem(f"idx: {row_idx}")
-            if pixmap.isNull():
-                thumbnail_item.setText(f"idx: {row_idx}\nNo thumbnail")
+        self._ensure_thumbnails_for_viewport()
+
+    def _visible_row_range(self) -> Tuple[int, int]:
+        """Returns the first and last result rows shown by the current view, inclusive."""
+        row_count = len(self.results)
+        if self.data_view.currentWidget() is self.grid_widget:
+            # Grid cells are a fixed size, so the visible items follow from the scroll offset
+            grid_size = self.grid_widget.gridSize()
+            viewport = self.grid_widget.viewport()
+            per_row = max(1, viewport.width() // grid_size.width())
+            first_row = self.grid_widget.verticalScrollBar().value() // grid_size.height()
+            visible_rows = viewport.height() // grid_size.height() + 1
+            return first_row * per_row, min(row_count, (first_row + visible_rows + 1) * per_row) - 1
+
+        first = self.table_view.rowAt(0)
+        last = self.table_view.rowAt(self.table_view.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1  # Rows end before the bottom of the viewport
+        return first, last
+
+    def _ensure_thumbnails_for_viewport(self) -> None:
+        """Loads or schedules thumbnails for the visible rows and a few either side."""
+        if not self.current_search or not self.results:
+            return
+        first, last = self._visible_row_range()
+        first = max(0, first - self.thumbnail_lookahead)
+        last = min(len(self.results) - 1, last + self.thumbnail_lookahead)
+
+        thread_pool = QThreadPool.globalInstance()
+        for row_idx in range(first, last + 1):
+            if row_idx in self._thumbnails_requested:
+                continue
+            self._thumbnails_requested.add(row_idx)
+            record = self.results[row_idx]
+
+            # Cached thumbnails load directly; the rest are generated in the background
+            cache_path = self._thumbnail_cache_path(record)
+            cached_thumbnail = load_cached_thumbnail(cache_path) if cache_path else None
+            if cached_thumbnail is not None:
+                self._set_thumbnail(row_idx, cached_thumbnail)
             else:
-                scaled_pix = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                thumbnail_item.setIcon(QIcon(scaled_pix))
-
-            thumbnail_item.setData(Qt.ItemDataRole.UserRole, row_idx)
-            self.grid_widget.addItem(thumbnail_item)
-
-            # Add image preview to table view
-            preview_label = QLabel()
-            scaled_pixmap = pixmap.scaledToHeight(self.table_widget.rowHeight(row_idx))
-            preview_label.setPixmap(scaled_pixmap)
-            preview_label.setScaledContents(False)  # Keeps aspect ratio without distortion
-            if scaled_pixmap.isNull():
-                preview_label.setText("No file preview")
-            self.table_widget.setCellWidget(row_idx, col_idx, preview_label)
-
-    def handle_table_item_double_click(self, item: QTableWidgetItem) -> None:
+                thread_pool.start(ThumbnailTask(
+                    self.current_search,
+                    record,
+                    row_idx,
+                    self._thumbnail_generation,
+                    cache_path,
+                    self._thumbnail_signals,
+                ))
+
+    def _thumbnail_cache_path(self, record: dict) -> Optional[Path]:
+        """Returns where the thumbnail for a record of the current search is cached, if it can be."""
+        return thumbnail_cache_path(self.current_search, record)
+
+    def _handle_thumbnail_ready(self, generation: int, row_idx: int, data: bytes) -> None:
+        """Receives a generated thumbnail on the GUI thread."""
+        if generation != self._thumbnail_generation:
+            return  # Results were repopulated since the task started
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+        self._set_thumbnail(row_idx, pixmap)
+
+    def _set_thumbnail(self, row_idx: int, pixmap: QPixmap) -> None:
+        """Shows a thumbnail in both the grid and table views."""
+        # The grid model reads its icons from the table model's previews
+        self.table_model.set_preview(row_idx, pixmap)
+
+    def handle_table_item_double_click(self, index: QModelIndex) -> None:
         """Opens detail window when a user double-clicks a table cell."""
-        if not self.current_search:
-            return
-        row_idx = item.row()
-        item_data = self.results[row_idx]
-        entry_key = item_data.get('entry_key')
-        search_results = self.current_search.fetch_results()
-        item_index = next(i for i, d in enumerate(search_results) if d.get('entry_key') == entry_key)
-        self.open_detail_window(self.current_search, item_index)
+        self._open_detail_window_for_row(index.row())
 
-    def handle_grid_item_double_click(self, item: QListWidgetItem) -> None:
+    def handle_grid_item_double_click(self, index: QModelIndex) -> None:
         """Opens detail window when a user double-clicks a thumbnail item."""
-        row_idx = self.grid_widget.row(item)
-        item_data = self.results[row_idx]
-        entry_key = item_data.get('entry_key')
-        search_results = self.current_search.fetch_results()
-        item_index = next(i for i, d in enumerate(search_results) if d.get('entry_key') == entry_key)
+        self._open_detail_window_for_row(index.row())
+
+    def _open_detail_window_for_row(self, row_idx: int) -> None:
+        """Opens a detail window on a result row, positioned among the search's unfiltered results."""
+        if not self.current_search:
+            return
+        if not self.entry_whitelist and not self.entry_blacklist:
+            item_index = row_idx  # Unfiltered rows are already in the search's result order
+        else:
+            item_index = self.current_search.result_index(self.results[row_idx])
         self.open_detail_window(self.current_search, item_index)
 
     def open_detail_window(self, search: Search, record_idx: int) -> None:
@@ -249,24 +546,6 @@ class CustomGridTableWidget(QWidget):
         """Displays the help text of the current search in a QMessageBox."""
         QMessageBox.information(self, "Search Info", self.current_search.get_help_text())
 
-    @staticmethod
-    def get_row_data(table_widget: QTableWidget, row_idx: int) -> dict[str, str]:
-        """Fetches all data in a given row of a QTableWidget as a dictionary.
-
-        Args:
-            table_widget (QTableWidget): The table widget.
-            row_idx (int): The row index.
-
-        Returns:
-            dict[str, str]: A dictionary mapping column headers to cell values.
-        """
-        headers = [table_widget.horizontalHeaderItem(col).text() for col in range(table_widget.columnCount())]
-        values = [
-            table_widget.item(row_idx, col).text() if table_widget.item(row_idx, col) else ""
-            for col in range(table_widget.columnCount())
-        ]
-        return dict(zip(headers, values))
-
 class OutputRouter(QObject):
     output_ready = pyqtSignal(str)
     _instance = None
@@ -425,15 +704,17 @@ class RunProcessesWidget(QWidget):
         self.process_lineedits = []
         self.process_status_lineedits = []
         self.process_help_buttons = []
+        self._help_button_processes: Dict[QPushButton, Any] = {}  # Resolved by the shared help slot
         self.process_rows = []
         self.process_start_times = {}
         self.process_end_times = {}
         self.current_process = None
         self.current_process_index = None
 
-        # Timer to time process execution
-        self.status_update_timer = QTimer()
-        self.status_update_timer.timeout.connect(self.update_all_process_statuses)
+        # Ticks the running process's elapsed time; owned by the widget, so it dies with it
+        self._status_timer = QTimer(self)
+        self._status_timer.setInterval(1000)
+        self._status_timer.timeout.connect(self._tick_process_status)
 
         # ****
         # Scroll area for processes
@@ -470,7 +751,8 @@ class RunProcessesWidget(QWidget):
             
             # Help button
             process_help_button = QPushButton("?")
-            process_help_button.clicked.connect(lambda checked, process=process: self.show_help(process))
+            process_help_button.clicked.connect(self._handle_help_button_click)
+            self._help_button_processes[process_help_button] = process
             
             # Add to lists
             self.process_checkboxes.append(process_checkbox)
@@ -515,11 +797,7 @@ class RunProcessesWidget(QWidget):
         """
         Enables or disables the 'Process' button if at least one process is checked.
         """
-        active_indices = [
-            i for i, cb in enumerate(self.process_checkboxes)
-            if cb.isChecked()
-        ]
-        self.process_button.setEnabled(bool(active_indices))
+        self.process_button.setEnabled(any(cb.isChecked() for cb in self.process_checkboxes))
         
     def select_all_processes(self) -> None:
         """Select all or deselect all processes based on the header checkbox state."""
@@ -580,11 +858,11 @@ class RunProcessesWidget(QWidget):
 
         # Done
         if index >= len(self.process_items):
-            self.status_update_timer.stop()
             for _, _, _, _, row_widget, _ in self.process_items:
                 row_widget.setStyleSheet("")
             self.current_process = None
             self.current_process_index = None
+            self._status_timer.stop()
             return
 
         # Unpack next item
@@ -601,8 +879,9 @@ class RunProcessesWidget(QWidget):
         row_widget.setStyleSheet("background-color: #FFFACD;")
         status_edit.setText("Processing...")
 
-        if not self.status_update_timer.isActive():
-            self.status_update_timer.start(1000)
+        # Elapsed time ticks only while this process runs
+        self.update_process_status(process_idx)
+        self._status_timer.start()
 
         divider = create_divider(name_edit.text(), total_width=50)
         self.output_text.appendPlainText(divider + "\n")
@@ -659,6 +938,7 @@ class RunProcessesWidget(QWidget):
             row_widget = self.process_rows[process_idx]
 
             # Mark end time
+            self._status_timer.stop()
             end_time = time.time()
             self.process_end_times[process_idx] = end_time
             duration = end_time - self.process_start_times[process_idx]
@@ -702,21 +982,36 @@ class RunProcessesWidget(QWidget):
             self.output_text.appendPlainText(f"Process failed: {msg}") 
         return success
         
-    def update_all_process_statuses(self) -> None:
-        """Updates the status text of any currently running process with elapsed time."""
+    def _tick_process_status(self) -> None:
+        """Refreshes the running process's elapsed time, stopping the timer once nothing is running."""
         if self.current_process_index is None:
+            self._status_timer.stop()
             return
-        start_time = self.process_start_times.get(self.current_process_index)
-        end_time = self.process_end_times.get(self.current_process_index)
+        self.update_process_status(self.current_process_index)
+
+    def update_process_status(self, process_idx: int) -> None:
+        """
+        Updates the status text of a running process with its elapsed time.
+
+        Args:
+            process_idx (int): Index of the process being timed.
+        """
+        if process_idx != self.current_process_index:
+            return  # A later process has taken over
+        start_time = self.process_start_times.get(process_idx)
+        end_time = self.process_end_times.get(process_idx)
         if start_time is None or end_time is not None:
-            self.current_process_index = None
             return
         elapsed = int(time.time() - start_time)
-        status_lineedit = self.process_status_lineedits[self.current_process_index]
+        status_lineedit = self.process_status_lineedits[process_idx]
         status_lineedit.setText(
             f"Started at {time.ctime(start_time)} | Elapsed: {elapsed}s"
         )
             
+    def _handle_help_button_click(self) -> None:
+        """Shows help for the process whose help button was clicked."""
+        self.show_help(self._help_button_processes[self.sender()])
+
     def show_help(self, process) -> None:
         """Shows a small help window in basic text."""
         logging.info(f"Showing help for {process.name}.")
@@ -736,6 +1031,86 @@ class RunProcessesWidget(QWidget):
         help_dialog.setLayout(layout)
         help_dialog.exec()
 
+# **** FUNCTIONS ****
+def encode_thumbnail(thumbnail: PILImage) -> bytes:
+    """
+    Encodes a generated thumbnail as PNG data, first shrinking it to fit THUMBNAIL_MAX_SIZE.
+    Shrinking in Pillow is much cheaper than encoding and decoding the full image.
+
+    Args:
+        thumbnail (PILImage): Generated thumbnail. Modified in place if it is too large.
+
+    Returns:
+        bytes: PNG data of the thumbnail.
+    """
+    if thumbnail.width > THUMBNAIL_MAX_SIZE[0] or thumbnail.height > THUMBNAIL_MAX_SIZE[1]:
+        thumbnail.thumbnail(THUMBNAIL_MAX_SIZE, Image.Resampling.BILINEAR)
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def thumbnail_cache_path(search: Search, record: dict) -> Optional[Path]:
+    """
+    Returns where the thumbnail a search generates for a record is cached.
+
+    Args:
+        search (Search): Search generating the thumbnail.
+        record (dict): Record of the search.
+
+    Returns:
+        Optional[Path]: Path of the cached thumbnail, or None if the record has no entry key to cache it by.
+    """
+    entry_key = search.data_structure.fetch_entry_key_from_entry(record)
+    if not entry_key:
+        return None
+
+    # The source file's modification time and size are part of the key, so an edited or replaced file gets a new thumbnail
+    source_path = search.thumbnail_source_path(record)
+    source_signature = ""
+    if source_path:
+        try:
+            source_stat = os.stat(source_path)
+            source_signature = f"{source_stat.st_mtime_ns}:{source_stat.st_size}"
+        except OSError:
+            pass
+    cache_name = hashlib.sha256(f"{search.name}:{entry_key}:{source_path}:{source_signature}".encode()).hexdigest()
+    return THUMBNAIL_CACHE_DIR / f"{cache_name}.png"
+
+def store_cached_thumbnail(cache_path: Path, data: bytes) -> None:
+    """
+    Writes PNG thumbnail data to the disk cache.
+
+    Args:
+        cache_path (Path): Path of the cached thumbnail.
+        data (bytes): PNG data of the thumbnail.
+    """
+    # Write to a temporary file first so readers never see a partial thumbnail
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, cache_path)
+
+def load_cached_thumbnail(cache_path: Path) -> Optional[QPixmap]:
+    """
+    Loads a thumbnail from the disk cache, reusing pixmaps already decoded this session.
+
+    Args:
+        cache_path (Path): Path of the cached thumbnail.
+
+    Returns:
+        Optional[QPixmap]: The thumbnail, or None if it is not cached on disk.
+    """
+    try:
+        mtime_ns = cache_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _decode_thumbnail(str(cache_path), mtime_ns)
+
+@lru_cache(maxsize=256)
+def _decode_thumbnail(path: str, mtime_ns: int) -> QPixmap:
+    """Decodes a thumbnail file. Keyed on mtime too, so a rewritten file is decoded again."""
+    return QPixmap(path)
+
 # ****
 if __name__ == "__main__":
     raise Exception("This script is not meant to be run directly.")